@@ -10,8 +10,10 @@ from tools.calendar_tools import (
     get_event_details,
     schedule_meeting,
     schedule_meeting_with_google_meet,
+    schedule_meetings_batch,
     modify_meeting_time,
     update_meeting_details,
+    update_meetings_batch,
     add_attendees_to_meeting,
     remove_attendees_from_meeting,
     delete_meeting,
@@ -19,7 +21,9 @@ from tools.calendar_tools import (
     add_google_meet_to_event,
     configure_event_notifications,
     lookup_event_by_reference,
-    convert_pst_to_utc
+    convert_pst_to_utc,
+    convert_pst_to_utc_many,
+    convert_to_utc
 )
 from tools.database_tools import (
     query_email_database,
@@ -53,9 +57,11 @@ Your capabilities:
 - Get detailed information about specific events
 - Schedule new meetings with attendees
 - Schedule meetings with Google Meet (automatic video conference link)
+- Schedule several meetings with Google Meet at once (batched)
 - Add Google Meet to existing events
 - Modify meeting times (reschedule)
 - Update meeting details (title, description, location)
+- Reschedule or update several meetings at once (batched)
 - Add attendees to existing meetings
 - Remove attendees from meetings
 - Update RSVP status (mark as going/not going/maybe)
@@ -84,14 +90,22 @@ Step-by-step process:
    - convert_pst_to_utc(pst_datetime="16:00", date="2025-10-15") for 4 PM
 4. Use the returned utc_datetime values in schedule_meeting or modify_meeting_time
 
-Example workflow for "tomorrow at 3pm - 4pm PST":
+Example workflow for "tomorrow at 3pm - 4pm PST" (October, so PDT is in effect):
 1. Call get_current_datetime → returns tomorrow_date: "2025-10-15"
-2. Call convert_pst_to_utc("15:00", "2025-10-15") → returns utc_datetime: "2025-10-15T23:00:00"
-3. Call convert_pst_to_utc("16:00", "2025-10-15") → returns utc_datetime: "2025-10-16T00:00:00"
-4. Call schedule_meeting(title="...", start_time="2025-10-15T23:00:00", end_time="2025-10-16T00:00:00", ...)
+2. Call convert_pst_to_utc("15:00", "2025-10-15") → returns utc_datetime: "2025-10-15T22:00:00"
+3. Call convert_pst_to_utc("16:00", "2025-10-15") → returns utc_datetime: "2025-10-15T23:00:00"
+4. Call schedule_meeting(title="...", start_time="2025-10-15T22:00:00", end_time="2025-10-15T23:00:00", ...)
 
 NEVER manually calculate UTC times - ALWAYS use convert_pst_to_utc tool for each time!
 
+When converting MANY times at once (e.g., several meetings for schedule_meetings_batch),
+use convert_pst_to_utc_many with parallel lists instead of one call per time:
+   - convert_pst_to_utc_many(pst_times=["09:00", "09:30"], dates=["2025-10-15", "2025-10-15"])
+
+If the user gives a time in ANOTHER timezone (e.g., "9am Eastern", "2pm London time"),
+use convert_to_utc with the IANA timezone name instead:
+   - convert_to_utc(local_time="09:00", date="2025-10-15", source_tz="America/New_York")
+
 TIME FORMAT for API:
 - All times passed to schedule_meeting, schedule_meeting_with_google_meet, and modify_meeting_time MUST be in ISO 8601 UTC format: YYYY-MM-DDTHH:MM:SS
 - Example: "2025-10-15T23:00:00" (not "2025-10-15T23:00:00Z", not "23:00", not "3pm")
@@ -99,6 +113,7 @@ TIME FORMAT for API:
 GOOGLE MEET VIDEO CONFERENCING:
 - If user mentions "Google Meet", "video call", "join with Meet", "virtual meeting" → use schedule_meeting_with_google_meet
 - To add Meet to existing event → use add_google_meet_to_event
+- To create SEVERAL Meet meetings at once (e.g., a week of standups) → use schedule_meetings_batch with all of them in one call
 - Google Meet link is automatically generated and sent to all attendees
 - The Meet link will be included in the event details
 
@@ -126,6 +141,7 @@ MEETING MODIFICATION:
      - "back/earlier" = subtract time
   5. Call modify_meeting_time with the new calculated start_time and end_time in ISO format
 - To update details: Use update_meeting_details for title/description/location
+- To change SEVERAL events at once (times, details or reminders) → use update_meetings_batch with all of them in one call
 - To manage attendees: Use add_attendees_to_meeting or remove_attendees_from_meeting
 - To update RSVP: Use update_rsvp_status with 'accepted', 'declined', 'tentative', or 'needsAction'
 
@@ -198,6 +214,8 @@ Always show event details after creating or modifying them.
     calendar_agent.tool(get_current_datetime)
     calendar_agent.tool(lookup_event_by_reference)
     calendar_agent.tool(convert_pst_to_utc)
+    calendar_agent.tool(convert_pst_to_utc_many)
+    calendar_agent.tool(convert_to_utc)
 
     # Register viewing tools
     calendar_agent.tool(list_upcoming_events)
@@ -206,10 +224,12 @@ Always show event details after creating or modifying them.
     # Register creation tools
     calendar_agent.tool(schedule_meeting)
     calendar_agent.tool(schedule_meeting_with_google_meet)
+    calendar_agent.tool(schedule_meetings_batch)
 
     # Register modification tools
     calendar_agent.tool(modify_meeting_time)
     calendar_agent.tool(update_meeting_details)
+    calendar_agent.tool(update_meetings_batch)
     calendar_agent.tool(add_attendees_to_meeting)
     calendar_agent.tool(remove_attendees_from_meeting)
     calendar_agent.tool(update_rsvp_status)
@@ -10,15 +10,22 @@ from tools.gmail_tools import (
     search_emails,
     read_email,
     mark_email_as_read,
+    mark_emails_as_read,
     mark_email_as_unread,
+    mark_emails_as_unread,
     archive_email,
+    archive_emails,
     trash_email,
+    trash_emails,
     delete_email,
+    delete_emails,
     get_labels,
     create_label,
     delete_label,
     add_label_to_email,
+    add_label_to_emails,
     remove_label_from_email,
+    remove_label_from_emails,
     create_draft_email,
     create_draft_reply,
     send_email,
@@ -51,6 +58,7 @@ Your capabilities:
 - Search for specific emails using Gmail query syntax
 - Mark emails as read/unread
 - Archive, trash, or permanently delete emails
+- Act on several emails at once (mark_emails_as_read, archive_emails, add_label_to_emails, etc.) instead of repeating single-email calls
 - Unsubscribe from marketing emails (automatic one-click or guided)
 - Manage labels (view, create, delete, add to emails, remove from emails)
 - Manage email contact database (query, add, remove contacts)
@@ -157,17 +165,24 @@ Combine operators:
 
     # Register modification tools
     gmail_agent.tool(mark_email_as_read)
+    gmail_agent.tool(mark_emails_as_read)
     gmail_agent.tool(mark_email_as_unread)
+    gmail_agent.tool(mark_emails_as_unread)
     gmail_agent.tool(archive_email)
+    gmail_agent.tool(archive_emails)
     gmail_agent.tool(trash_email)
+    gmail_agent.tool(trash_emails)
     gmail_agent.tool(delete_email)
+    gmail_agent.tool(delete_emails)
 
     # Register label tools
     gmail_agent.tool(get_labels)
     gmail_agent.tool(create_label)
     gmail_agent.tool(delete_label)
     gmail_agent.tool(add_label_to_email)
+    gmail_agent.tool(add_label_to_emails)
     gmail_agent.tool(remove_label_from_email)
+    gmail_agent.tool(remove_label_from_emails)
 
     # Register email database tools (use FIRST before searching)
     gmail_agent.tool(query_email_database)
@@ -1,6 +1,7 @@
 """Graph execution logic"""
 
 import os
+import logging
 from graph.state import UnifiedState
 from config.settings import THREAD_ID, SEPARATOR_LENGTH, MEMORY_SEPARATOR_LENGTH
 from utils.logging import get_logger
@@ -50,13 +51,14 @@ async def run_gmail_graph(graph):
     try:
         # Start the graph
         state = None
+        logged_messages = 0
         logger.info("Starting graph execution with memory debugging")
 
         while True:
             # Log current state before processing
             if state:
                 logger.debug(f"Current state before processing: {list(state.keys())}")
-                logger.debug(f"Messages in state: {state.get('messages', [])}")
+                logger.debug("Messages in state: %d", len(state.get('messages', [])))
             
             # Run the graph until it hits an interrupt
             events = []
@@ -68,10 +70,19 @@ async def run_gmail_graph(graph):
 
             # Log final state
             if state:
+                messages = state.get('messages', [])
                 logger.info(f"Final state after graph run: {list(state.keys())}")
-                logger.info(f"Messages in final state: {len(state.get('messages', []))} messages")
-                for i, msg in enumerate(state.get('messages', [])):
-                    logger.debug(f"Message {i}: {msg}")
+                logger.info(f"Messages in final state: {len(messages)} messages")
+                logger.debug(
+                    "messages: count=%d tail_hash=%x",
+                    len(messages),
+                    hash(_message_content(messages[-1])) if messages else 0
+                )
+                # Only log messages added since the last turn
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i in range(logged_messages, len(messages)):
+                        logger.debug("Message %d: %s", i, messages[i])
+                logged_messages = len(messages)
 
             # Check if we've reached the end
             if state and not state.get("continue_conversation", True):
@@ -124,6 +135,13 @@ async def run_gmail_graph(graph):
         traceback.print_exc()
 
 
+def _message_content(msg) -> str:
+    """Get the text content of a message stored as a dict or a LangChain message"""
+    if isinstance(msg, dict):
+        return str(msg.get('content', ''))
+    return str(getattr(msg, 'content', msg))
+
+
 def _display_help():
     """Display help information"""
     print("\n" + "="*MEMORY_SEPARATOR_LENGTH)
@@ -159,15 +177,20 @@ def _display_memory(snapshot, config):
     if current_state and current_state.get("messages"):
         logger.info(f"Found {len(current_state['messages'])} messages in memory")
         print("Conversation History (from LangGraph memory):")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        lines = []
         for i, msg in enumerate(current_state["messages"], 1):
             if isinstance(msg, dict):
                 role = msg.get("role", "unknown")
                 content = msg.get("content", "")
-                print(f"  {i}. {role.upper()}: {content}")
-                logger.debug(f"Message {i}: {role} - {content[:50]}...")
+                lines.append(f"  {i}. {role.upper()}: {content}")
+                if debug_enabled:
+                    logger.debug(f"Message {i}: {role} - {content[:50]}...")
             else:
-                print(f"  {i}. {msg}")
-                logger.debug(f"Message {i}: {str(msg)[:50]}...")
+                lines.append(f"  {i}. {msg}")
+                if debug_enabled:
+                    logger.debug(f"Message {i}: {str(msg)[:50]}...")
+        print("\n".join(lines))
     else:
         logger.warning("No messages found in current state")
         print("No conversation history found")
@@ -1,11 +1,24 @@
 """Add Google Meet to calendar events tools"""
 
+import asyncio
 from typing import Optional, List, Dict, Any
+# pydantic only validates typing_extensions.TypedDict on Python < 3.12
+from typing_extensions import TypedDict, NotRequired
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
-def add_google_meet_to_event(
+class MeetingRequest(TypedDict):
+    """One meeting for schedule_meetings_batch"""
+    title: str
+    start_time: str
+    end_time: str
+    description: NotRequired[Optional[str]]
+    location: NotRequired[Optional[str]]
+    attendees: NotRequired[Optional[List[str]]]
+
+
+async def add_google_meet_to_event(
     ctx: RunContext[CalendarDeps],
     event_id: str
 ) -> Optional[Dict[str, Any]]:
@@ -26,11 +39,12 @@ def add_google_meet_to_event(
     - Sent to all attendees
     - Available for joining the meeting
     """
-    event = ctx.deps.calendar_service.add_google_meet(event_id)
+    # Run the blocking Calendar API call off the event loop
+    event = await asyncio.to_thread(ctx.deps.calendar_service.add_google_meet, event_id)
     return event
 
 
-def schedule_meeting_with_google_meet(
+async def schedule_meeting_with_google_meet(
     ctx: RunContext[CalendarDeps],
     title: str,
     start_time: str,
@@ -63,7 +77,8 @@ def schedule_meeting_with_google_meet(
     
     This automatically creates a Google Meet link that all attendees can use to join.
     """
-    event = ctx.deps.calendar_service.create_event_with_meet(
+    event = await asyncio.to_thread(
+        ctx.deps.calendar_service.create_event_with_meet,
         summary=title,
         start_time=start_time,
         end_time=end_time,
@@ -74,3 +89,52 @@ def schedule_meeting_with_google_meet(
     
     return event
 
+
+async def schedule_meetings_batch(
+    ctx: RunContext[CalendarDeps],
+    meetings: List[MeetingRequest]
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Schedule several calendar meetings with Google Meet in one batched request
+    
+    Args:
+        meetings: List of meetings, each a dict with:
+            - title: Meeting title/subject
+            - start_time: Start time in ISO format (YYYY-MM-DDTHH:MM:SS)
+            - end_time: End time in ISO format (YYYY-MM-DDTHH:MM:SS)
+            - description: Optional meeting description or agenda
+            - location: Optional meeting location
+            - attendees: Optional list of attendee email addresses
+    
+    Returns:
+        For each meeting in the same order, its event id, html_link and meet_link
+        (None if that meeting failed)
+    
+    Example:
+        schedule_meetings_batch(meetings=[
+            {"title": "Standup", "start_time": "2024-03-20T16:00:00", "end_time": "2024-03-20T16:15:00"},
+            {"title": "Standup", "start_time": "2024-03-21T16:00:00", "end_time": "2024-03-21T16:15:00"}
+        ])
+    
+    Use this instead of calling schedule_meeting_with_google_meet repeatedly when
+    creating more than one meeting at a time.
+    """
+    requests = [
+        {
+            'summary': meeting['title'],
+            'start_time': meeting['start_time'],
+            'end_time': meeting['end_time'],
+            'description': meeting.get('description'),
+            'location': meeting.get('location'),
+            'attendees': meeting.get('attendees')
+        }
+        for meeting in meetings
+    ]
+    # The caller already knows titles and times; only fetch ids and links back
+    events = await asyncio.to_thread(
+        ctx.deps.calendar_service.create_events_batch_with_meet,
+        requests,
+        parse=False
+    )
+    
+    return events
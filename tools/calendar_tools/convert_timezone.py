@@ -1,10 +1,78 @@
 """Timezone conversion helper tool for Calendar agent"""
 
-from datetime import datetime
-from typing import Dict, Any
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, TypedDict
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from pydantic_ai import RunContext
 from .core import CalendarDeps
-import pytz
+
+
+@lru_cache(maxsize=64)
+def _zi(name: str) -> ZoneInfo:
+    """Resolve an IANA timezone name, caching the lookup per name"""
+    return ZoneInfo(name)
+
+
+# Default source timezone, resolved once at import
+_PACIFIC = _zi('America/Los_Angeles')
+_PST_OFFSET = timedelta(hours=-8)
+
+# "9", "9:30", "09:30" or "09:30:15" with optional surrounding whitespace
+_TIME_RE = re.compile(r'\s*(\d{1,2})(?::(\d{2})(?::(\d{2}))?)?\s*')
+
+# "YYYY-MM-DD" with optional surrounding whitespace; like strptime, one-digit
+# months and days ("2025-6-1") are accepted
+_DATE_RE = re.compile(r'\s*(\d{4})-(\d{1,2})-(\d{1,2})\s*')
+
+# 24-hour clock hour -> (12-hour clock hour, AM/PM)
+_HOUR12 = tuple(((h % 12) or 12, 'AM' if h < 12 else 'PM') for h in range(24))
+
+# Pacific UTC offset for every day of the current and next year, keyed by
+# date ordinal. DST transition days are left out so they always go through
+# zoneinfo, which knows the exact hour the clocks change.
+_PACIFIC_OFFSET_BY_ORDINAL = {}
+for _ordinal in range(datetime(datetime.now().year, 1, 1).toordinal(),
+                      datetime(datetime.now().year + 2, 1, 1).toordinal()):
+    _day = datetime.fromordinal(_ordinal)
+    _offset = _PACIFIC.utcoffset(_day)
+    if _offset == _PACIFIC.utcoffset(_day.replace(hour=23, minute=59, second=59)):
+        _PACIFIC_OFFSET_BY_ORDINAL[_ordinal] = _offset
+del _ordinal, _day, _offset
+
+
+class LocalConversionResult(TypedDict):
+    """Shape of a successful local time -> UTC conversion"""
+    utc_datetime: str
+    local_datetime: str
+    local_time: str
+    utc_time: str
+    conversion_note: str
+    date: str
+    utc_date: str
+    timezone: str
+    source_tz: str
+    dst_active: bool
+    utc_offset: str
+
+
+class ConversionResult(TypedDict):
+    """Shape of a successful PST/PDT -> UTC conversion"""
+    utc_datetime: str
+    pst_datetime: str
+    pst_time: str
+    utc_time: str
+    conversion_note: str
+    date: str
+    utc_date: str
+    timezone: str
+    dst_active: bool
+    offset_hours: int
+
+
+# Shared shape of every failed conversion; callers add the 'error' message
+_ERR_TEMPLATE = {'utc_datetime': None}
 
 
 def convert_pst_to_utc(
@@ -25,10 +93,10 @@ def convert_pst_to_utc(
     Example:
         convert_pst_to_utc("15:00", "2025-10-15")
         Returns: {
-            'utc_datetime': '2025-10-15T23:00:00',
+            'utc_datetime': '2025-10-15T22:00:00',
             'pst_datetime': '2025-10-15T15:00:00',
-            'pst_time': '3:00 PM PST',
-            'utc_time': '11:00 PM UTC'
+            'pst_time': '3:00 PM PDT',
+            'utc_time': '10:00 PM UTC'
         }
 
     Use this tool whenever you need to create or modify calendar events
@@ -38,72 +106,179 @@ def convert_pst_to_utc(
     calling schedule_meeting, schedule_meeting_with_google_meet, or
     modify_meeting_time.
     """
-    # Parse the time (handle both HH:MM and HH:MM:SS formats)
-    time_parts = pst_datetime.strip().split(':')
-    hour = int(time_parts[0])
-    minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-    second = int(time_parts[2]) if len(time_parts) > 2 else 0
-
-    # Validate time
-    if not (0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59):
-        return {
-            'error': f'Invalid time: {pst_datetime}. Hour must be 0-23, minute and second must be 0-59.',
-            'utc_datetime': None
+    # Copy so callers can't mutate the cached entry
+    return dict(_convert_pst_to_utc_cached(pst_datetime, date))
+
+
+def convert_pst_to_utc_many(
+    ctx: RunContext[CalendarDeps],
+    pst_times: List[str],
+    dates: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Convert several PST/PDT times to UTC in one call
+
+    Args:
+        pst_times: Times in PST format (e.g., ["09:00", "09:30", "15:00"])
+        dates: Dates in YYYY-MM-DD format, one per time (e.g., ["2025-10-15", "2025-10-15", "2025-10-16"])
+
+    Returns:
+        List of conversion results in input order, each shaped like convert_pst_to_utc's result
+
+    Use this instead of calling convert_pst_to_utc repeatedly when scheduling
+    several meetings, e.g., the start and end times of a week of standups.
+    """
+    if len(pst_times) != len(dates):
+        return [{
+            **_ERR_TEMPLATE,
+            'error': f'Got {len(pst_times)} times but {len(dates)} dates. Pass exactly one date per time.'
+        }]
+
+    # Repeated (time, date) pairs are served from the conversion cache
+    return [dict(_convert_pst_to_utc_cached(t, d)) for t, d in zip(pst_times, dates)]
+
+
+def convert_to_utc(
+    ctx: RunContext[CalendarDeps],
+    local_time: str,
+    date: str,
+    source_tz: str = 'America/Los_Angeles'
+) -> Dict[str, Any]:
+    """
+    Convert a time in any IANA timezone to UTC format for Google Calendar API
+
+    Args:
+        local_time: Time in the source timezone (e.g., "15:00" for 3 PM, "09:30" for 9:30 AM)
+        date: Date in YYYY-MM-DD format (e.g., "2025-10-15")
+        source_tz: IANA timezone name (e.g., "America/New_York", "Europe/London").
+            Defaults to "America/Los_Angeles"
+
+    Returns:
+        Dictionary with UTC datetime string and formatted times
+
+    Example:
+        convert_to_utc("09:00", "2025-10-15", "America/New_York")
+        Returns: {
+            'utc_datetime': '2025-10-15T13:00:00',
+            'local_time': '9:00 AM EDT',
+            'utc_time': '1:00 PM UTC',
+            'utc_offset': '-04:00'
         }
 
-    # Validate date format
+    Use this tool when the user gives a time in a timezone other than PST/PDT.
+    """
+    # Copy so callers can't mutate the cached entry
+    return dict(_convert_to_utc_cached(local_time, date, source_tz))
+
+
+@lru_cache(maxsize=1024)
+def _convert_pst_to_utc_cached(pst_datetime: str, date: str) -> Dict[str, Any]:
+    """Pacific conversion reshaped into the PST-specific keys, memoized on (time, date)"""
+    result = _convert_to_utc_cached(pst_datetime, date, 'America/Los_Angeles')
+    if result['utc_datetime'] is None:
+        return result
+
+    is_dst = result['dst_active']
+    timezone_abbr = result['timezone']
+    offset_hours = 7 if is_dst else 8
+
+    return ConversionResult(
+        utc_datetime=result['utc_datetime'],
+        pst_datetime=result['local_datetime'],
+        pst_time=result['local_time'],
+        utc_time=result['utc_time'],
+        conversion_note=f'Converted {timezone_abbr} to UTC by adding {offset_hours} hours (DST {"active" if is_dst else "inactive"})',
+        date=result['date'],
+        utc_date=result['utc_date'],
+        timezone=timezone_abbr,
+        dst_active=is_dst,
+        offset_hours=offset_hours
+    )
+
+
+@lru_cache(maxsize=1024)
+def _convert_to_utc_cached(local_time: str, date: str, source_tz: str) -> Dict[str, Any]:
+    """Pure local time -> UTC conversion, memoized on (time, date, timezone)"""
     try:
-        datetime.strptime(date, '%Y-%m-%d')
-    except ValueError:
+        zone = _zi(source_tz)
+    except (ZoneInfoNotFoundError, ValueError):
         return {
-            'error': f'Invalid date format: {date}. Expected YYYY-MM-DD.',
-            'utc_datetime': None
+            **_ERR_TEMPLATE,
+            'error': f'Unknown timezone: {source_tz}. Use an IANA name such as America/New_York.'
         }
 
-    # Convert PST/PDT to UTC using pytz for accurate DST handling
-    pacific = pytz.timezone('America/Los_Angeles')
-    utc = pytz.UTC
-
-    # Create naive datetime from date and time
-    naive_dt = datetime(
-        year=int(date.split('-')[0]),
-        month=int(date.split('-')[1]),
-        day=int(date.split('-')[2]),
-        hour=hour,
-        minute=minute,
-        second=second
-    )
+    # Parse the time in a single regex scan (handles H, HH:MM and HH:MM:SS formats)
+    match = _TIME_RE.fullmatch(local_time)
+    if not match:
+        return {
+            **_ERR_TEMPLATE,
+            'error': f'Invalid time: {local_time}. Hour must be 0-23, minute and second must be 0-59.'
+        }
+    hour = int(match[1])
+    minute = int(match[2] or 0)
+    second = int(match[3] or 0)
 
-    # Localize to Pacific timezone (this handles DST automatically)
-    pacific_dt = pacific.localize(naive_dt)
+    # Validate time (the regex only checks digit counts)
+    if not (hour <= 23 and minute <= 59 and second <= 59):
+        return {
+            **_ERR_TEMPLATE,
+            'error': f'Invalid time: {local_time}. Hour must be 0-23, minute and second must be 0-59.'
+        }
 
-    # Convert to UTC
-    utc_dt = pacific_dt.astimezone(utc)
+    # Build the wall-clock time in one constructor call; impossible dates
+    # such as 2025-02-30 raise ValueError
+    date_match = _DATE_RE.fullmatch(date)
+    if not date_match:
+        return {**_ERR_TEMPLATE, 'error': f'Invalid date format: {date}. Expected YYYY-MM-DD.'}
+    try:
+        naive_dt = datetime(int(date_match[1]), int(date_match[2]), int(date_match[3]),
+                            hour, minute, second)
+    except ValueError:
+        return {**_ERR_TEMPLATE, 'error': f'Invalid date format: {date}. Expected YYYY-MM-DD.'}
 
-    # Format UTC datetime for Google Calendar API
-    utc_datetime = utc_dt.strftime('%Y-%m-%dT%H:%M:%S')
-    pst_datetime_formatted = f"{date}T{hour:02d}:{minute:02d}:{second:02d}"
+    # Most Pacific dates hit the precomputed table; everything else asks
+    # zoneinfo directly, without building an aware datetime
+    offset = _PACIFIC_OFFSET_BY_ORDINAL.get(naive_dt.toordinal()) if zone is _PACIFIC else None
+    if offset is None:
+        # Read a repeated (fall-back) or skipped (spring-forward) wall-clock
+        # time as standard time, like pytz's localize did: fold=0 is the DST
+        # reading of the repeated hour, so switch to fold=1 whenever it is DST
+        if zone.dst(naive_dt):
+            naive_dt = naive_dt.replace(fold=1)
+        offset = zone.utcoffset(naive_dt)
 
-    # Determine if DST is active
-    is_dst = bool(pacific_dt.dst())
-    timezone_abbr = 'PDT' if is_dst else 'PST'
-    offset_hours = 7 if is_dst else 8
+    # Convert to UTC (subtracting a negative offset adds the hours)
+    utc_dt = naive_dt - offset
+
+    # Format UTC datetime for Google Calendar API (utc_dt is naive, so no
+    # offset suffix); the date is its first 10 characters
+    utc_datetime = utc_dt.isoformat(timespec='seconds')
+    local_datetime = naive_dt.isoformat(timespec='seconds')
+
+    if zone is _PACIFIC:
+        # Anything but the standard offset means DST, no second tzinfo lookup
+        is_dst = offset != _PST_OFFSET
+        timezone_abbr = 'PDT' if is_dst else 'PST'
+    else:
+        is_dst = bool(zone.dst(naive_dt))
+        timezone_abbr = zone.tzname(naive_dt)
+    offset_minutes = int(offset.total_seconds()) // 60
+    utc_offset = f"{'-' if offset_minutes < 0 else '+'}{abs(offset_minutes) // 60:02d}:{abs(offset_minutes) % 60:02d}"
 
     # Format human-readable times
-    pst_hour_12 = hour % 12 if hour % 12 != 0 else 12
-    pst_ampm = 'AM' if hour < 12 else 'PM'
-    utc_hour_12 = utc_dt.hour % 12 if utc_dt.hour % 12 != 0 else 12
-    utc_ampm = 'AM' if utc_dt.hour < 12 else 'PM'
-
-    return {
-        'utc_datetime': utc_datetime,
-        'pst_datetime': pst_datetime_formatted,
-        'pst_time': f'{pst_hour_12}:{minute:02d} {pst_ampm} {timezone_abbr}',
-        'utc_time': f'{utc_hour_12}:{minute:02d} {utc_ampm} UTC',
-        'conversion_note': f'Converted {timezone_abbr} to UTC by adding {offset_hours} hours (DST {"active" if is_dst else "inactive"})',
-        'date': date,
-        'utc_date': utc_dt.strftime('%Y-%m-%d'),
-        'timezone': timezone_abbr,
-        'dst_active': is_dst,
-        'offset_hours': offset_hours
-    }
+    local_hour_12, local_ampm = _HOUR12[hour]
+    utc_hour_12, utc_ampm = _HOUR12[utc_dt.hour]
+
+    return LocalConversionResult(
+        utc_datetime=utc_datetime,
+        local_datetime=local_datetime,
+        local_time=f'{local_hour_12}:{minute:02d} {local_ampm} {timezone_abbr}',
+        utc_time=f'{utc_hour_12}:{utc_dt.minute:02d} {utc_ampm} UTC',
+        conversion_note=f'Converted {timezone_abbr} (UTC{utc_offset}) to UTC',
+        date=local_datetime[:10],
+        utc_date=utc_datetime[:10],
+        timezone=timezone_abbr,
+        source_tz=source_tz,
+        dst_active=is_dst,
+        utc_offset=utc_offset
+    )
@@ -1,17 +1,26 @@
 """Core Google Calendar API service layer - CalendarTools class and dependencies"""
 
 import os
-import pickle
+import logging
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import httplib2
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+
+logger = logging.getLogger(__name__)
 
 
 # Google Calendar API scopes
@@ -19,12 +28,106 @@ SCOPES = [
     'https://www.googleapis.com/auth/calendar',  # Full calendar access
 ]
 
+# Google Calendar accepts at most 50 sub-requests per batch HTTP request
+BATCH_LIMIT = 50
+
+# Authenticated (credentials, service) pairs keyed by (credentials_path, token_path),
+# so building the API client happens once per process rather than per instance
+_SERVICE_CACHE: Dict[Tuple[str, str], Tuple[Credentials, Any]] = {}
+_SERVICE_LOCK = threading.Lock()
+
+# Google Calendar returns at most 250 events per events().list page
+MAX_PAGE_SIZE = 250
+
+# Partial-response selectors covering exactly the fields _parse_events_batch reads
+_EVENT_FIELDS = (
+    'id,summary,description,start,end,location,'
+    'attendees(email,displayName,responseStatus),organizer/email,status,htmlLink,'
+    'conferenceData/entryPoints(entryPointType,uri)'
+)
+_LIST_FIELDS = f'items({_EVENT_FIELDS}),nextPageToken'
+
+# Just enough of a created event to identify and join it (see parse=False)
+_CREATED_FIELDS = 'id,htmlLink,conferenceData/entryPoints(entryPointType,uri)'
+
+# How long listed and fetched events are served from memory before re-querying
+CACHE_TTL_SECONDS = 30.0
+# Entries kept per cache; the oldest is evicted when full
+CACHE_MAX_SIZE = 128
+
 
 @dataclass
 class CalendarDeps:
     """Dependencies for Calendar tools - holds calendar context"""
     events: List[dict]
     calendar_service: 'CalendarTools'
+    # (lowercased title, event id, title) per entry of events, for reference lookups
+    event_titles: List[Tuple[str, Optional[str], Optional[str]]] = field(default_factory=list)
+
+
+def index_event_titles(events: List[dict]) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Precompute the lowercased titles lookup_event_by_reference matches against"""
+    return [(e.get('summary', '').lower(), e.get('id'), e.get('summary')) for e in events]
+
+
+def _meet_link(conference_data: Optional[dict]) -> Optional[str]:
+    """Get the Google Meet link from an event's conferenceData, stopping at the first video entry point"""
+    if not conference_data:
+        return None
+    for entry in conference_data.get('entryPoints', ()):
+        if entry.get('entryPointType') == 'video':
+            return entry.get('uri')
+    return None
+
+
+def _parse_events_batch(items: Iterable[dict]) -> List[Dict[str, Any]]:
+    """
+    Parse Google Calendar events into a readable format in a single pass
+
+    Missing start/end/organizer fields come back as None instead of raising,
+    so one malformed event no longer needs a try/except around every parse.
+    """
+    empty = {}
+    parsed_events = []
+    append = parsed_events.append
+
+    for event in items:
+        get = event.get
+        start = get('start') or empty
+        end = get('end') or empty
+
+        append({
+            'id': get('id'),
+            'summary': get('summary', 'No Title'),
+            'description': get('description', ''),
+            # All-day events carry 'date' instead of 'dateTime'; only look it up then
+            'start_time': start.get('dateTime') or start.get('date'),
+            'end_time': end.get('dateTime') or end.get('date'),
+            'location': get('location', ''),
+            'attendees': [
+                {
+                    'email': attendee.get('email'),
+                    'name': attendee.get('displayName') or attendee.get('email'),
+                    'response_status': attendee.get('responseStatus', 'needsAction')
+                }
+                for attendee in get('attendees', ())
+            ],
+            'organizer': (get('organizer') or empty).get('email'),
+            'status': get('status', 'confirmed'),
+            'html_link': get('htmlLink', ''),
+            'meet_link': _meet_link(get('conferenceData'))
+        })
+
+    return parsed_events
+
+
+def _created_event_summary(event: dict) -> Dict[str, Any]:
+    """Reduce a _CREATED_FIELDS insert response to its id and links"""
+    return {
+        'id': event.get('id'),
+        'html_link': event.get('htmlLink', ''),
+        'meet_link': _meet_link(event.get('conferenceData'))
+    }
 
 
 class CalendarTools:
@@ -33,7 +136,8 @@ class CalendarTools:
     def __init__(
         self,
         credentials_path: Optional[str] = None,
-        token_path: Optional[str] = None
+        token_path: Optional[str] = None,
+        cache_ttl: float = CACHE_TTL_SECONDS
     ):
         self.credentials_path = credentials_path or os.getenv(
             'GOOGLE_CREDENTIALS_PATH',
@@ -44,16 +148,45 @@ class CalendarTools:
             'config/google_calendar_token.json'
         )
         self.service = None
-        self.authenticate()
+        self._events = None
+        self._calendars = None
+        self._credentials = None
+        self._local = threading.local()
+
+        # Short-lived caches so repeated lookups in one planning loop skip the API
+        self.cache_ttl = cache_ttl
+        self._list_cache: Dict[tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._event_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # The caches are written from tool worker threads; the generation is
+        # bumped on every invalidation so a lookup that started before a change
+        # does not store its stale result afterwards
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+
+        key = (self.credentials_path, self.token_path)
+        with _SERVICE_LOCK:
+            cached = _SERVICE_CACHE.get(key)
+            if cached:
+                self._credentials, self.service = cached
+                self._bind_collections()
+            else:
+                self.authenticate()
 
     def authenticate(self) -> None:
         """Authenticate with Google Calendar API"""
-        creds = None
-
-        # Load existing token
-        if Path(self.token_path).exists():
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
+        # Nothing to do while this client's credentials are still valid; expired
+        # ones are refreshed below without re-reading the token file
+        creds = self._credentials
+        if creds and creds.valid and self.service:
+            return
+
+        # Load existing token (tokens saved in the old pickle format fail to
+        # parse and fall through to a fresh sign-in that rewrites them as JSON)
+        if creds is None and Path(self.token_path).exists():
+            try:
+                creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
+            except (ValueError, UnicodeDecodeError):
+                creds = None
 
         # Refresh or create new credentials
         if not creds or not creds.valid:
@@ -74,10 +207,45 @@ class CalendarTools:
 
             # Save credentials
             Path(self.token_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(creds, token)
+            with open(self.token_path, 'w') as token:
+                token.write(creds.to_json())
+
+        self._credentials = creds
+        # Use the discovery document bundled with the client library instead of
+        # fetching it, and skip the on-disk discovery cache
+        self.service = build(
+            'calendar',
+            'v3',
+            http=self._authorized_http(),
+            requestBuilder=self._build_request,
+            cache_discovery=False,
+            static_discovery=True
+        )
+        _SERVICE_CACHE[(self.credentials_path, self.token_path)] = (creds, self.service)
+        self._bind_collections()
+
+    def _bind_collections(self) -> None:
+        """Create the events/calendars resource collections once instead of per API call"""
+        self._events = self.service.events()
+        self._calendars = self.service.calendars()
 
-        self.service = build('calendar', 'v3', credentials=creds)
+    def _authorized_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """
+        Get this thread's authorized HTTP transport, creating it on first use
+
+        httplib2 connections are not thread-safe and tools call the API via
+        asyncio.to_thread, so each worker thread keeps its own keep-alive
+        connection that is reused across all API calls made from it.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def _build_request(self, http, *args, **kwargs) -> HttpRequest:
+        """Request builder that sends every API request over the calling thread's transport"""
+        return HttpRequest(self._authorized_http(), *args, **kwargs)
 
     def list_upcoming_events(
         self,
@@ -125,46 +293,91 @@ class CalendarTools:
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
 
+        cache_key = (max_results, start_time, end_time, days_ahead)
+        with self._cache_lock:
+            cached = self._list_cache.get(cache_key)
+            generation = self._cache_generation
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return list(cached[1])
+
         try:
-            # Set time range
-            if start_time:
-                time_min = start_time if start_time.endswith('Z') else start_time + 'Z'
-            else:
-                time_min = datetime.utcnow().isoformat() + 'Z'
+            # Pull pages lazily and stop as soon as max_results events are parsed
+            events = list(islice(
+                self.iter_events_in_range(
+                    start_time=start_time,
+                    end_time=end_time,
+                    days_ahead=days_ahead,
+                    page_size=min(max_results, MAX_PAGE_SIZE)
+                ),
+                max_results
+            ))
+            self._store_cached(self._list_cache, cache_key, events, generation)
+            return list(events)
 
-            if end_time:
-                time_max = end_time if end_time.endswith('Z') else end_time + 'Z'
-            else:
-                # Parse start time to add days_ahead
-                if start_time:
-                    start_dt = datetime.fromisoformat(start_time.replace('Z', ''))
-                else:
-                    start_dt = datetime.utcnow()
-                time_max = (start_dt + timedelta(days=days_ahead)).isoformat() + 'Z'
-
-            events_result = self.service.events().list(
-                calendarId='primary',
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+        except HttpError as error:
+            logger.error("Error fetching calendar events: %s", error)
+            return []
 
-            events = events_result.get('items', [])
+    def iter_events_in_range(
+        self,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        days_ahead: int = 7,
+        page_size: int = MAX_PAGE_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield parsed calendar events within a time range, one page at a time
 
-            # Parse events into readable format
-            parsed_events = []
-            for event in events:
-                parsed_event = self._parse_event(event)
-                if parsed_event:
-                    parsed_events.append(parsed_event)
+        The next page is only requested once the caller has consumed the
+        current one, so callers that stop early never fetch it.
 
-            return parsed_events
+        Args:
+            start_time: Start of time range in ISO format. If not provided, uses current time.
+            end_time: End of time range in ISO format. If not provided, looks days_ahead from start_time.
+            days_ahead: Days to look ahead if end_time not specified (default 7)
+            page_size: Events requested per page (at most MAX_PAGE_SIZE)
 
-        except HttpError as error:
-            print(f"Error fetching calendar events: {error}")
-            return []
+        Yields:
+            Event dictionaries in start time order
+
+        Raises:
+            HttpError: If fetching a page fails
+        """
+        if not self.service:
+            raise RuntimeError("Calendar service not authenticated")
+
+        # Set time range
+        if start_time:
+            time_min = start_time if start_time.endswith('Z') else start_time + 'Z'
+            start_dt = None
+        else:
+            start_dt = datetime.utcnow()
+            time_min = start_dt.isoformat() + 'Z'
+
+        if end_time:
+            time_max = end_time if end_time.endswith('Z') else end_time + 'Z'
+        else:
+            # Parse start time to add days_ahead (fromisoformat, not strptime)
+            if start_dt is None:
+                start_dt = datetime.fromisoformat(start_time.rstrip('Z'))
+            time_max = (start_dt + timedelta(days=days_ahead)).isoformat() + 'Z'
+
+        events = self._events
+        request = events.list(
+            calendarId='primary',
+            timeMin=time_min,
+            timeMax=time_max,
+            maxResults=page_size,
+            singleEvents=True,
+            orderBy='startTime',
+            fields=_LIST_FIELDS
+        )
+
+        while request is not None:
+            response = request.execute()
+            # Parse each page into readable format in a single pass
+            yield from _parse_events_batch(response.get('items', []))
+            request = events.list_next(request, response)
 
     def get_event(self, event_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -179,62 +392,48 @@ class CalendarTools:
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
 
+        with self._cache_lock:
+            cached = self._event_cache.get(event_id)
+            generation = self._cache_generation
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return dict(cached[1])
+
         try:
-            event = self.service.events().get(
+            event = self._events.get(
                 calendarId='primary',
-                eventId=event_id
+                eventId=event_id,
+                fields=_EVENT_FIELDS
             ).execute()
 
-            return self._parse_event(event)
+            parsed_event = self._parse_event(event)
+            self._store_cached(self._event_cache, event_id, parsed_event, generation)
+            return dict(parsed_event)
 
         except HttpError as error:
-            print(f"Error fetching event {event_id}: {error}")
+            logger.error("Error fetching event %s: %s", event_id, error)
             return None
 
+    def _store_cached(self, cache: Dict[Any, Tuple[float, Any]], key: Any, value: Any, generation: int) -> None:
+        """Cache a lookup result unless the cache was invalidated since the lookup began"""
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            cache.pop(key, None)
+            if len(cache) >= CACHE_MAX_SIZE:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = (time.monotonic(), value)
+
+    def _invalidate_cache(self, event_id: Optional[str] = None) -> None:
+        """Drop cached listings (and the given event) after a calendar change"""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._list_cache.clear()
+            if event_id:
+                self._event_cache.pop(event_id, None)
+
     def _parse_event(self, event: dict) -> Optional[Dict[str, Any]]:
         """Parse a Google Calendar event into a readable format"""
-        try:
-            # Get event times
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            end = event['end'].get('dateTime', event['end'].get('date'))
-            
-            # Parse attendees
-            attendees = []
-            if 'attendees' in event:
-                attendees = [
-                    {
-                        'email': attendee.get('email'),
-                        'name': attendee.get('displayName', attendee.get('email')),
-                        'response_status': attendee.get('responseStatus', 'needsAction')
-                    }
-                    for attendee in event['attendees']
-                ]
-
-            # Check for Google Meet conference data
-            meet_link = None
-            if 'conferenceData' in event:
-                entry_points = event['conferenceData'].get('entryPoints', [])
-                for entry in entry_points:
-                    if entry.get('entryPointType') == 'video':
-                        meet_link = entry.get('uri')
-                        break
-
-            return {
-                'id': event['id'],
-                'summary': event.get('summary', 'No Title'),
-                'description': event.get('description', ''),
-                'start_time': start,
-                'end_time': end,
-                'location': event.get('location', ''),
-                'attendees': attendees,
-                'organizer': event.get('organizer', {}).get('email'),
-                'status': event.get('status', 'confirmed'),
-                'html_link': event.get('htmlLink', ''),
-                'meet_link': meet_link
-            }
-        except Exception as e:
-            print(f"Error parsing event: {e}")
-            return None
+        return _parse_events_batch((event,))[0]
 
     def create_event(
         self,
@@ -243,7 +442,8 @@ class CalendarTools:
         end_time: str,
         description: Optional[str] = None,
         location: Optional[str] = None,
-        attendees: Optional[List[str]] = None
+        attendees: Optional[List[str]] = None,
+        parse: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Create a new calendar event
@@ -255,45 +455,36 @@ class CalendarTools:
             description: Event description
             location: Event location
             attendees: List of attendee email addresses
+            parse: If False, return only the event's id, html_link and meet_link
 
         Returns:
             Created event details or None if failed
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache()
 
         try:
-            event_body = {
-                'summary': summary,
-                'start': {
-                    'dateTime': start_time,
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': end_time,
-                    'timeZone': 'UTC',
-                },
-            }
-
-            if description:
-                event_body['description'] = description
-            
-            if location:
-                event_body['location'] = location
-            
-            if attendees:
-                event_body['attendees'] = [{'email': email} for email in attendees]
-
-            event = self.service.events().insert(
+            event_body = self._event_body(
+                summary=summary,
+                start_time=start_time,
+                end_time=end_time,
+                description=description,
+                location=location,
+                attendees=attendees
+            )
+
+            event = self._events.insert(
                 calendarId='primary',
                 body=event_body,
-                sendUpdates='all'  # Send email notifications to attendees
+                sendUpdates='all',  # Send email notifications to attendees
+                fields=_EVENT_FIELDS if parse else _CREATED_FIELDS
             ).execute()
 
-            return self._parse_event(event)
+            return self._parse_event(event) if parse else _created_event_summary(event)
 
         except HttpError as error:
-            print(f"Error creating event: {error}")
+            logger.error("Error creating event: %s", error)
             return None
 
     def update_event(
@@ -321,37 +512,23 @@ class CalendarTools:
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache(event_id)
 
         try:
-            # Get existing event
-            event = self.service.events().get(
-                calendarId='primary',
-                eventId=event_id
-            ).execute()
+            changes = self._event_changes(summary, start_time, end_time, description, location)
 
-            # Update fields if provided
-            if summary:
-                event['summary'] = summary
-            if start_time:
-                event['start'] = {'dateTime': start_time, 'timeZone': 'UTC'}
-            if end_time:
-                event['end'] = {'dateTime': end_time, 'timeZone': 'UTC'}
-            if description is not None:
-                event['description'] = description
-            if location is not None:
-                event['location'] = location
-
-            updated_event = self.service.events().update(
+            updated_event = self._events.patch(
                 calendarId='primary',
                 eventId=event_id,
-                body=event,
-                sendUpdates='all'
+                body=changes,
+                sendUpdates='all',
+                fields=_EVENT_FIELDS
             ).execute()
 
             return self._parse_event(updated_event)
 
         except HttpError as error:
-            print(f"Error updating event: {error}")
+            logger.error("Error updating event: %s", error)
             return None
 
     def add_attendees(
@@ -371,15 +548,16 @@ class CalendarTools:
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache(event_id)
 
         try:
-            # Get existing event
-            event = self.service.events().get(
+            # Get existing attendees only
+            event = self._events.get(
                 calendarId='primary',
-                eventId=event_id
+                eventId=event_id,
+                fields='attendees'
             ).execute()
 
-            # Get existing attendees
             existing_attendees = event.get('attendees', [])
             existing_emails = {a['email'] for a in existing_attendees}
 
@@ -388,19 +566,18 @@ class CalendarTools:
                 if email not in existing_emails:
                     existing_attendees.append({'email': email})
 
-            event['attendees'] = existing_attendees
-
-            updated_event = self.service.events().update(
+            updated_event = self._events.patch(
                 calendarId='primary',
                 eventId=event_id,
-                body=event,
-                sendUpdates='all'
+                body={'attendees': existing_attendees},
+                sendUpdates='all',
+                fields=_EVENT_FIELDS
             ).execute()
 
             return self._parse_event(updated_event)
 
         except HttpError as error:
-            print(f"Error adding attendees: {error}")
+            logger.error("Error adding attendees: %s", error)
             return None
 
     def remove_attendees(
@@ -420,12 +597,14 @@ class CalendarTools:
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache(event_id)
 
         try:
-            # Get existing event
-            event = self.service.events().get(
+            # Get existing attendees only
+            event = self._events.get(
                 calendarId='primary',
-                eventId=event_id
+                eventId=event_id,
+                fields='attendees'
             ).execute()
 
             # Remove specified attendees
@@ -437,19 +616,18 @@ class CalendarTools:
                 if a['email'] not in emails_to_remove
             ]
 
-            event['attendees'] = updated_attendees
-
-            updated_event = self.service.events().update(
+            updated_event = self._events.patch(
                 calendarId='primary',
                 eventId=event_id,
-                body=event,
-                sendUpdates='all'
+                body={'attendees': updated_attendees},
+                sendUpdates='all',
+                fields=_EVENT_FIELDS
             ).execute()
 
             return self._parse_event(updated_event)
 
         except HttpError as error:
-            print(f"Error removing attendees: {error}")
+            logger.error("Error removing attendees: %s", error)
             return None
 
     def delete_event(self, event_id: str) -> bool:
@@ -464,9 +642,10 @@ class CalendarTools:
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache(event_id)
 
         try:
-            self.service.events().delete(
+            self._events.delete(
                 calendarId='primary',
                 eventId=event_id,
                 sendUpdates='all'
@@ -474,7 +653,7 @@ class CalendarTools:
             return True
 
         except HttpError as error:
-            print(f"Error deleting event: {error}")
+            logger.error("Error deleting event: %s", error)
             return False
 
     def update_rsvp_status(
@@ -496,24 +675,26 @@ class CalendarTools:
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache(event_id)
 
         # Validate response status
         valid_statuses = ['accepted', 'declined', 'tentative', 'needsAction']
         if response_status not in valid_statuses:
-            print(f"Invalid response status. Must be one of: {', '.join(valid_statuses)}")
+            logger.warning("Invalid response status. Must be one of: %s", ', '.join(valid_statuses))
             return None
 
         try:
             # Get the authenticated user's email if not provided
             if not attendee_email:
                 # Get user's primary email
-                calendar = self.service.calendars().get(calendarId='primary').execute()
+                calendar = self._calendars.get(calendarId='primary').execute()
                 attendee_email = calendar.get('id')  # Calendar ID is the user's email
 
-            # Get existing event
-            event = self.service.events().get(
+            # Get existing attendees and organizer only
+            event = self._events.get(
                 calendarId='primary',
-                eventId=event_id
+                eventId=event_id,
+                fields='attendees,organizer'
             ).execute()
 
             # Update the attendee's response status
@@ -535,20 +716,19 @@ class CalendarTools:
                 })
                 updated = True
 
-            event['attendees'] = attendees
-
-            # Update the event
-            updated_event = self.service.events().update(
+            # Update the event's attendees
+            updated_event = self._events.patch(
                 calendarId='primary',
                 eventId=event_id,
-                body=event,
-                sendUpdates='all'
+                body={'attendees': attendees},
+                sendUpdates='all',
+                fields=_EVENT_FIELDS
             ).execute()
 
             return self._parse_event(updated_event)
 
         except HttpError as error:
-            print(f"Error updating RSVP status: {error}")
+            logger.error("Error updating RSVP status: %s", error)
             return None
 
     def add_google_meet(self, event_id: str) -> Optional[Dict[str, Any]]:
@@ -563,16 +743,11 @@ class CalendarTools:
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache(event_id)
 
         try:
-            # Get existing event
-            event = self.service.events().get(
-                calendarId='primary',
-                eventId=event_id
-            ).execute()
-
             # Add Google Meet conference data
-            event['conferenceData'] = {
+            conference_data = {
                 'createRequest': {
                     'requestId': f"meet-{event_id}",
                     'conferenceSolutionKey': {
@@ -581,20 +756,21 @@ class CalendarTools:
                 }
             }
 
-            # Update the event with conference data
+            # Patch the event with conference data
             # Must use conferenceDataVersion=1 to enable conference creation
-            updated_event = self.service.events().update(
+            updated_event = self._events.patch(
                 calendarId='primary',
                 eventId=event_id,
-                body=event,
+                body={'conferenceData': conference_data},
                 conferenceDataVersion=1,
-                sendUpdates='all'
+                sendUpdates='all',
+                fields=_EVENT_FIELDS
             ).execute()
 
             return self._parse_event(updated_event)
 
         except HttpError as error:
-            print(f"Error adding Google Meet: {error}")
+            logger.error("Error adding Google Meet: %s", error)
             return None
 
     def create_event_with_meet(
@@ -604,7 +780,8 @@ class CalendarTools:
         end_time: str,
         description: Optional[str] = None,
         location: Optional[str] = None,
-        attendees: Optional[List[str]] = None
+        attendees: Optional[List[str]] = None,
+        parse: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Create a new calendar event with Google Meet video conference
@@ -616,57 +793,360 @@ class CalendarTools:
             description: Event description
             location: Event location
             attendees: List of attendee email addresses
+            parse: If False, return only the event's id, html_link and meet_link
 
         Returns:
             Created event details with Google Meet link or None if failed
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache()
 
         try:
-            event_body = {
-                'summary': summary,
-                'start': {
-                    'dateTime': start_time,
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': end_time,
-                    'timeZone': 'UTC',
-                },
-                'conferenceData': {
-                    'createRequest': {
-                        'requestId': f"meet-{start_time}",
-                        'conferenceSolutionKey': {
-                            'type': 'hangoutsMeet'
-                        }
-                    }
-                }
-            }
-
-            if description:
-                event_body['description'] = description
-            
-            if location:
-                event_body['location'] = location
-            
-            if attendees:
-                event_body['attendees'] = [{'email': email} for email in attendees]
+            event_body = self._meet_event_body(
+                summary=summary,
+                start_time=start_time,
+                end_time=end_time,
+                description=description,
+                location=location,
+                attendees=attendees,
+                request_id=f"meet-{start_time}"
+            )
 
             # Create event with conference data
-            event = self.service.events().insert(
+            event = self._events.insert(
                 calendarId='primary',
                 body=event_body,
                 conferenceDataVersion=1,  # Required for Google Meet
-                sendUpdates='all'
+                sendUpdates='all',
+                fields=_EVENT_FIELDS if parse else _CREATED_FIELDS
             ).execute()
 
-            return self._parse_event(event)
+            return self._parse_event(event) if parse else _created_event_summary(event)
 
         except HttpError as error:
-            print(f"Error creating event with Google Meet: {error}")
+            logger.error("Error creating event with Google Meet: %s", error)
             return None
 
+    def create_events_batch(
+        self,
+        meetings: List[Dict[str, Any]],
+        parse: bool = True
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several calendar events using batch HTTP requests
+
+        Up to BATCH_LIMIT inserts are sent per HTTP request instead of one
+        round trip per event.
+
+        Args:
+            meetings: List of dicts with the create_event arguments
+                     (summary, start_time, end_time and optional description,
+                     location, attendees)
+            parse: If False, return only each event's id, html_link and meet_link
+
+        Returns:
+            Created event details in the same order as meetings, with None
+            for any event that failed
+        """
+        if not self.service:
+            raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache()
+
+        requests = [
+            self._events.insert(
+                calendarId='primary',
+                body=self._event_body(
+                    summary=meeting['summary'],
+                    start_time=meeting['start_time'],
+                    end_time=meeting['end_time'],
+                    description=meeting.get('description'),
+                    location=meeting.get('location'),
+                    attendees=meeting.get('attendees')
+                ),
+                sendUpdates='all',
+                fields=_EVENT_FIELDS if parse else _CREATED_FIELDS
+            )
+            for meeting in meetings
+        ]
+
+        responses = self._execute_batched(requests, "Error creating event")
+        convert = self._parse_event if parse else _created_event_summary
+        return [
+            convert(response) if response is not None else None
+            for response in responses
+        ]
+
+    def create_events_batch_with_meet(
+        self,
+        meetings: List[Dict[str, Any]],
+        parse: bool = True
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several calendar events with Google Meet using batch HTTP requests
+
+        Up to BATCH_LIMIT inserts are sent per HTTP request instead of one
+        round trip per event.
+
+        Args:
+            meetings: List of dicts with the create_event_with_meet arguments
+                     (summary, start_time, end_time and optional description,
+                     location, attendees)
+            parse: If False, return only each event's id, html_link and meet_link
+
+        Returns:
+            Created event details in the same order as meetings, with None
+            for any event that failed
+        """
+        if not self.service:
+            raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache()
+
+        requests = [
+            self._events.insert(
+                calendarId='primary',
+                body=self._meet_event_body(
+                    summary=meeting['summary'],
+                    start_time=meeting['start_time'],
+                    end_time=meeting['end_time'],
+                    description=meeting.get('description'),
+                    location=meeting.get('location'),
+                    attendees=meeting.get('attendees'),
+                    request_id=f"meet-{meeting['start_time']}-{index}"
+                ),
+                conferenceDataVersion=1,  # Required for Google Meet
+                sendUpdates='all',
+                fields=_EVENT_FIELDS if parse else _CREATED_FIELDS
+            )
+            for index, meeting in enumerate(meetings)
+        ]
+
+        responses = self._execute_batched(requests, "Error creating event with Google Meet")
+        convert = self._parse_event if parse else _created_event_summary
+        return [
+            convert(response) if response is not None else None
+            for response in responses
+        ]
+
+    def batch_get_events(self, event_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get details of several calendar events using batch HTTP requests
+
+        Args:
+            event_ids: Google Calendar event IDs
+
+        Returns:
+            Event details in the same order as event_ids, with None for any
+            event that could not be fetched
+        """
+        if not self.service:
+            raise RuntimeError("Calendar service not authenticated")
+
+        requests = [
+            self._events.get(calendarId='primary', eventId=event_id, fields=_EVENT_FIELDS)
+            for event_id in event_ids
+        ]
+
+        responses = self._execute_batched(requests, "Error fetching event")
+        return [
+            self._parse_event(response) if response is not None else None
+            for response in responses
+        ]
+
+    def batch_delete_events(self, event_ids: List[str]) -> List[bool]:
+        """
+        Delete several calendar events using batch HTTP requests
+
+        Args:
+            event_ids: Google Calendar event IDs
+
+        Returns:
+            One flag per event ID, True if that event was deleted
+        """
+        if not self.service:
+            raise RuntimeError("Calendar service not authenticated")
+        for event_id in event_ids:
+            self._invalidate_cache(event_id)
+
+        requests = [
+            self._events.delete(
+                calendarId='primary',
+                eventId=event_id,
+                sendUpdates='all'
+            )
+            for event_id in event_ids
+        ]
+
+        # A successful delete has an empty body, so only failures stay None
+        responses = self._execute_batched(requests, "Error deleting event")
+        return [response is not None for response in responses]
+
+    def batch_update_events(self, updates: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Patch several calendar events using batch HTTP requests
+
+        Args:
+            updates: One dict per event with event_id and any of summary,
+                     start_time, end_time, description, location and
+                     reminders (minutes before the event)
+
+        Returns:
+            Updated event details in the same order as updates, with None
+            for any event that could not be updated
+        """
+        if not self.service:
+            raise RuntimeError("Calendar service not authenticated")
+        for update in updates:
+            self._invalidate_cache(update['event_id'])
+
+        requests = []
+        for update in updates:
+            changes = self._event_changes(
+                update.get('summary'),
+                update.get('start_time'),
+                update.get('end_time'),
+                update.get('description'),
+                update.get('location')
+            )
+            if update.get('reminders') is not None:
+                changes['reminders'] = self._reminders_body(update['reminders'])
+
+            requests.append(self._events.patch(
+                calendarId='primary',
+                eventId=update['event_id'],
+                body=changes,
+                sendUpdates='all',
+                fields=_EVENT_FIELDS
+            ))
+
+        responses = self._execute_batched(requests, "Error updating event")
+        return [
+            self._parse_event(response) if response is not None else None
+            for response in responses
+        ]
+
+    def _execute_batched(self, requests: List[HttpRequest], error_message: str) -> List[Any]:
+        """
+        Execute API requests BATCH_LIMIT at a time instead of one round trip each
+
+        Args:
+            requests: Unexecuted API requests
+            error_message: Prefix printed with the error of a failed request
+
+        Returns:
+            Responses in the same order as requests, with None for failures
+        """
+        responses: List[Any] = [None] * len(requests)
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                logger.error("%s: %s", error_message, exception)
+                return
+            responses[int(request_id)] = response
+
+        pending = iter(enumerate(requests))
+        while True:
+            chunk = list(islice(pending, BATCH_LIMIT))
+            if not chunk:
+                break
+
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for index, request in chunk:
+                batch.add(request, request_id=str(index))
+
+            try:
+                batch.execute()
+            except HttpError as error:
+                logger.error("%s: %s", error_message, error)
+
+        return responses
+
+    def _event_body(
+        self,
+        summary: str,
+        start_time: str,
+        end_time: str,
+        description: Optional[str],
+        location: Optional[str],
+        attendees: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build an event insert body with UTC start and end times"""
+        event_body = {
+            'summary': summary,
+            'start': {
+                'dateTime': start_time,
+                'timeZone': 'UTC',
+            },
+            'end': {
+                'dateTime': end_time,
+                'timeZone': 'UTC',
+            },
+        }
+
+        if description:
+            event_body['description'] = description
+
+        if location:
+            event_body['location'] = location
+
+        if attendees:
+            event_body['attendees'] = [{'email': email} for email in attendees]
+
+        return event_body
+
+    def _event_changes(
+        self,
+        summary: Optional[str],
+        start_time: Optional[str],
+        end_time: Optional[str],
+        description: Optional[str],
+        location: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build a patch body with only the provided fields; patch leaves the rest untouched"""
+        changes = {}
+        if summary:
+            changes['summary'] = summary
+        if start_time:
+            changes['start'] = {'dateTime': start_time, 'timeZone': 'UTC'}
+        if end_time:
+            changes['end'] = {'dateTime': end_time, 'timeZone': 'UTC'}
+        if description is not None:
+            changes['description'] = description
+        if location is not None:
+            changes['location'] = location
+        return changes
+
+    def _reminders_body(self, reminders: List[int]) -> Dict[str, Any]:
+        """Build custom popup reminders replacing the calendar defaults"""
+        return {
+            'useDefault': False,
+            'overrides': [
+                {'method': 'popup', 'minutes': minutes} for minutes in reminders
+            ]
+        }
+
+    def _meet_event_body(
+        self,
+        summary: str,
+        start_time: str,
+        end_time: str,
+        description: Optional[str],
+        location: Optional[str],
+        attendees: Optional[List[str]],
+        request_id: str
+    ) -> Dict[str, Any]:
+        """Build an event insert body that requests a Google Meet conference"""
+        event_body = self._event_body(summary, start_time, end_time, description, location, attendees)
+        event_body['conferenceData'] = {
+            'createRequest': {
+                'requestId': request_id,
+                'conferenceSolutionKey': {
+                    'type': 'hangoutsMeet'
+                }
+            }
+        }
+        return event_body
+
     def set_event_reminders(
         self,
         event_id: str,
@@ -685,33 +1165,21 @@ class CalendarTools:
         """
         if not self.service:
             raise RuntimeError("Calendar service not authenticated")
+        self._invalidate_cache(event_id)
 
         try:
-            # Get existing event
-            event = self.service.events().get(
-                calendarId='primary',
-                eventId=event_id
-            ).execute()
-
-            # Set custom reminders
-            event['reminders'] = {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'popup', 'minutes': minutes} for minutes in reminders
-                ]
-            }
-
-            # Update the event
-            updated_event = self.service.events().update(
+            # Patch only the reminders of the event
+            updated_event = self._events.patch(
                 calendarId='primary',
                 eventId=event_id,
-                body=event,
-                sendUpdates='all'
+                body={'reminders': self._reminders_body(reminders)},
+                sendUpdates='all',
+                fields=_EVENT_FIELDS
             ).execute()
 
             return self._parse_event(updated_event)
 
         except HttpError as error:
-            print(f"Error setting event reminders: {error}")
+            logger.error("Error setting event reminders: %s", error)
             return None
 
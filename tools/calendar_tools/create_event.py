@@ -1,11 +1,12 @@
 """Create calendar event tool"""
 
+import asyncio
 from typing import Optional, List, Dict, Any
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
-def schedule_meeting(
+async def schedule_meeting(
     ctx: RunContext[CalendarDeps],
     title: str,
     start_time: str,
@@ -36,7 +37,8 @@ def schedule_meeting(
             attendees=["john@example.com", "sarah@example.com"]
         )
     """
-    event = ctx.deps.calendar_service.create_event(
+    event = await asyncio.to_thread(
+        ctx.deps.calendar_service.create_event,
         summary=title,
         start_time=start_time,
         end_time=end_time,
@@ -1,10 +1,11 @@
 """Delete calendar event tool"""
 
+import asyncio
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
-def delete_meeting(ctx: RunContext[CalendarDeps], event_id: str) -> bool:
+async def delete_meeting(ctx: RunContext[CalendarDeps], event_id: str) -> bool:
     """
     Delete a calendar meeting/event
     
@@ -17,6 +18,6 @@ def delete_meeting(ctx: RunContext[CalendarDeps], event_id: str) -> bool:
     Example:
         delete_meeting(event_id="abc123xyz")
     """
-    success = ctx.deps.calendar_service.delete_event(event_id)
+    success = await asyncio.to_thread(ctx.deps.calendar_service.delete_event, event_id)
     return success
 
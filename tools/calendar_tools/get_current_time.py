@@ -1,11 +1,23 @@
 """Get current date and time tool"""
 
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from zoneinfo import ZoneInfo
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
+_PACIFIC = ZoneInfo('America/Los_Angeles')
+_UTC = ZoneInfo('UTC')
+
+# datetime.weekday() -> day name, same as strftime('%A') in the C locale
+_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# (epoch second, result) of the last call; repeat calls within that second reuse it
+_last_result: Tuple[int, Dict[str, Any]] = (0, {})
+
+
 def get_current_datetime(ctx: RunContext[CalendarDeps]) -> Dict[str, Any]:
     """
     Get the current date and time in PST/PDT timezone
@@ -21,34 +33,51 @@ def get_current_datetime(ctx: RunContext[CalendarDeps]) -> Dict[str, Any]:
     - Calculate dates like "tomorrow", "next week", "in 3 days"
 
     IMPORTANT: The times returned are in PST/PDT (UTC-8 or UTC-7)
-    For Google Calendar API, you MUST convert to UTC:
-    - PST (winter): Add 8 hours to convert to UTC
-    - PDT (summer): Add 7 hours to convert to UTC
-
-    Example: "3 PM PST tomorrow" where tomorrow is 2025-10-16:
-    - Tomorrow's date: 2025-10-16
-    - Start time in PST: 2025-10-16T15:00:00 (3 PM)
-    - Start time in UTC: 2025-10-16T23:00:00 (3 PM + 8 hours = 11 PM UTC)
-    - End time in PST: 2025-10-16T16:00:00 (4 PM)
-    - End time in UTC: 2025-10-17T00:00:00 (4 PM + 8 hours = midnight next day UTC)
+    For Google Calendar API, you MUST convert to UTC with convert_pst_to_utc.
+    utc_offset_hours tells you how many hours UTC is ahead right now
+    (8 during PST, 7 during PDT).
+
+    next_hour_start_utc / next_hour_end_utc give a ready-made one-hour slot
+    starting at the next full hour, already in UTC, for "in an hour" requests.
     """
-    now = datetime.now()
+    global _last_result
+
+    second = int(time.time())
+    if _last_result[0] == second:
+        # Copy so callers can't mutate the cached entry
+        return dict(_last_result[1])
+
+    # Pacific wall-clock time regardless of the machine's local timezone
+    now = datetime.now(_PACIFIC)
     tomorrow = now + timedelta(days=1)
+    utc_offset_hours = -int(now.utcoffset().total_seconds() // 3600)
+    timezone_abbr = now.tzname()
+
+    # One-hour slot starting at the next full hour, in UTC for the Calendar API
+    next_hour = now.astimezone(_UTC).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+    # Slice date and time out of one ISO string instead of separate strftime calls
+    iso = now.replace(tzinfo=None).isoformat()
 
-    return {
-        'datetime': now.isoformat(),
-        'date': now.strftime('%Y-%m-%d'),
-        'time': now.strftime('%H:%M:%S'),
-        'day_of_week': now.strftime('%A'),
-        'formatted': now.strftime('%A, %B %d, %Y at %I:%M %p PST'),
+    result = {
+        'datetime': iso,
+        'date': iso[:10],
+        'time': iso[11:19],
+        'day_of_week': _DAYS[now.weekday()],
+        'formatted': now.strftime(f'%A, %B %d, %Y at %I:%M %p {timezone_abbr}'),
         'year': now.year,
         'month': now.month,
         'day': now.day,
         'hour': now.hour,
         'minute': now.minute,
-        'tomorrow_date': tomorrow.strftime('%Y-%m-%d'),
-        'tomorrow_day': tomorrow.strftime('%A'),
-        'timezone_note': 'Times are in PST/PDT. For Google Calendar API, convert to UTC by adding 8 hours (PST) or 7 hours (PDT)',
-        'utc_offset_hours': 8  # Assume PST for now (you can make this dynamic based on DST if needed)
+        'tomorrow_date': tomorrow.isoformat()[:10],
+        'tomorrow_day': _DAYS[tomorrow.weekday()],
+        'timezone': timezone_abbr,
+        'timezone_note': f'Times are in {timezone_abbr}. For Google Calendar API, convert to UTC by adding {utc_offset_hours} hours',
+        'utc_offset_hours': utc_offset_hours,
+        'next_hour_start_utc': next_hour.strftime('%Y-%m-%dT%H:%M:%S'),
+        'next_hour_end_utc': (next_hour + timedelta(hours=1)).strftime('%Y-%m-%dT%H:%M:%S')
     }
+    _last_result = (second, result)
+    return dict(result)
 
@@ -1,11 +1,12 @@
 """Get specific calendar event details tool"""
 
+import asyncio
 from typing import Optional, Dict, Any
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
-def get_event_details(ctx: RunContext[CalendarDeps], event_id: str) -> Optional[Dict[str, Any]]:
+async def get_event_details(ctx: RunContext[CalendarDeps], event_id: str) -> Optional[Dict[str, Any]]:
     """
     Get detailed information about a specific calendar event
     
@@ -15,6 +16,6 @@ def get_event_details(ctx: RunContext[CalendarDeps], event_id: str) -> Optional[
     Returns:
         Event details including title, time, attendees, location, description
     """
-    event = ctx.deps.calendar_service.get_event(event_id)
+    event = await asyncio.to_thread(ctx.deps.calendar_service.get_event, event_id)
     return event
 
@@ -1,11 +1,12 @@
 """List upcoming calendar events tool"""
 
+import asyncio
 from typing import List, Dict, Any, Optional
 from pydantic_ai import RunContext
-from .core import CalendarDeps
+from .core import CalendarDeps, index_event_titles
 
 
-def list_upcoming_events(
+async def list_upcoming_events(
     ctx: RunContext[CalendarDeps],
     max_results: int = 10,
     start_time: Optional[str] = None,
@@ -32,7 +33,8 @@ def list_upcoming_events(
     IMPORTANT: Always use get_current_datetime() tool first to get the correct current date/time,
     then calculate the appropriate start_time and end_time based on the user's query.
     """
-    events = ctx.deps.calendar_service.list_events_in_range(
+    events = await asyncio.to_thread(
+        ctx.deps.calendar_service.list_events_in_range,
         max_results=max_results,
         start_time=start_time,
         end_time=end_time
@@ -40,6 +42,7 @@ def list_upcoming_events(
 
     # Update context
     ctx.deps.events = events
+    ctx.deps.event_titles = index_event_titles(events)
 
     return events
 
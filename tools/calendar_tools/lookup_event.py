@@ -1,8 +1,19 @@
 """Helper tool to lookup events by number or title"""
 
+import re
 from typing import Optional, Dict, Any
 from pydantic_ai import RunContext
-from .core import CalendarDeps
+from .core import CalendarDeps, index_event_titles
+
+
+# Ordinal words accepted as event numbers
+NUMBER_WORDS = {
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
+    "1st": 1, "2nd": 2, "3rd": 3, "4th": 4, "5th": 5
+}
+
+# A bare number, or the first ordinal word anywhere in the reference
+_REFERENCE_RE = re.compile(r'^(\d+)$|(' + '|'.join(NUMBER_WORDS) + ')')
 
 
 def lookup_event_by_reference(
@@ -24,26 +35,12 @@ def lookup_event_by_reference(
     if not ctx.deps.events:
         return "No events in context. Please list events first using list_upcoming_events."
 
-    # Parse numeric references
-    number_words = {
-        "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5,
-        "1st": 1, "2nd": 2, "3rd": 3, "4th": 4, "5th": 5
-    }
-
     # Try to parse as number
     event_number = None
-    ref_lower = reference.lower().strip()
-
-    if ref_lower in number_words:
-        event_number = number_words[ref_lower]
-    elif ref_lower.isdigit():
-        event_number = int(ref_lower)
-    else:
-        # Try word extraction
-        for word, num in number_words.items():
-            if word in ref_lower:
-                event_number = num
-                break
+    match = _REFERENCE_RE.search(reference.lower().strip())
+    if match:
+        digits, word = match.groups()
+        event_number = int(digits) if digits else NUMBER_WORDS[word]
 
     # Look up by number
     if event_number is not None:
@@ -55,13 +52,14 @@ def lookup_event_by_reference(
         else:
             return f"Event number {event_number} not found. Only {len(ctx.deps.events)} events in context."
 
-    # Look up by title (partial match)
+    # Look up by title (partial match) against the titles lowercased at list time
+    titles = ctx.deps.event_titles
+    if len(titles) != len(ctx.deps.events):
+        titles = ctx.deps.event_titles = index_event_titles(ctx.deps.events)
     ref_lower = reference.lower()
-    for idx, event in enumerate(ctx.deps.events):
-        event_title = event.get('summary', '').lower()
+    for idx, (event_title, event_id, summary) in enumerate(titles):
         if ref_lower in event_title or event_title in ref_lower:
-            event_id = event.get('id')
-            return f"Event ID: {event_id} (Event #{idx+1}: {event.get('summary')})"
+            return f"Event ID: {event_id} (Event #{idx+1}: {summary})"
 
     available_events = ', '.join([f"#{i+1}: {e.get('summary')}" for i, e in enumerate(ctx.deps.events)])
     return f"Could not find event matching '{reference}'. Available events: {available_events}"
@@ -1,11 +1,12 @@
 """Manage calendar event attendees tools"""
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
-def add_attendees_to_meeting(
+async def add_attendees_to_meeting(
     ctx: RunContext[CalendarDeps],
     event_id: str,
     attendee_emails: List[str]
@@ -26,7 +27,8 @@ def add_attendees_to_meeting(
             attendee_emails=["newperson@example.com", "another@example.com"]
         )
     """
-    event = ctx.deps.calendar_service.add_attendees(
+    event = await asyncio.to_thread(
+        ctx.deps.calendar_service.add_attendees,
         event_id=event_id,
         attendee_emails=attendee_emails
     )
@@ -34,7 +36,7 @@ def add_attendees_to_meeting(
     return event
 
 
-def remove_attendees_from_meeting(
+async def remove_attendees_from_meeting(
     ctx: RunContext[CalendarDeps],
     event_id: str,
     attendee_emails: List[str]
@@ -55,7 +57,8 @@ def remove_attendees_from_meeting(
             attendee_emails=["person@example.com"]
         )
     """
-    event = ctx.deps.calendar_service.remove_attendees(
+    event = await asyncio.to_thread(
+        ctx.deps.calendar_service.remove_attendees,
         event_id=event_id,
         attendee_emails=attendee_emails
     )
@@ -1,11 +1,12 @@
 """Set event notification reminders tool"""
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
-def configure_event_notifications(
+async def configure_event_notifications(
     ctx: RunContext[CalendarDeps],
     event_id: str,
     reminder_minutes: List[int]
@@ -48,7 +49,8 @@ def configure_event_notifications(
     
     Note: This replaces any existing reminders on the event.
     """
-    event = ctx.deps.calendar_service.set_event_reminders(
+    event = await asyncio.to_thread(
+        ctx.deps.calendar_service.set_event_reminders,
         event_id=event_id,
         reminders=reminder_minutes
     )
@@ -1,11 +1,25 @@
 """Update calendar event tool"""
 
-from typing import Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Dict, Any
+# pydantic only validates typing_extensions.TypedDict on Python < 3.12
+from typing_extensions import TypedDict, NotRequired
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
-def modify_meeting_time(
+class MeetingUpdate(TypedDict):
+    """One event change for update_meetings_batch"""
+    event_id: str
+    start_time: NotRequired[Optional[str]]
+    end_time: NotRequired[Optional[str]]
+    title: NotRequired[Optional[str]]
+    description: NotRequired[Optional[str]]
+    location: NotRequired[Optional[str]]
+    reminder_minutes: NotRequired[Optional[List[int]]]
+
+
+async def modify_meeting_time(
     ctx: RunContext[CalendarDeps],
     event_id: str,
     start_time: Optional[str] = None,
@@ -29,7 +43,8 @@ def modify_meeting_time(
             end_time="2024-03-20T11:00:00"
         )
     """
-    event = ctx.deps.calendar_service.update_event(
+    event = await asyncio.to_thread(
+        ctx.deps.calendar_service.update_event,
         event_id=event_id,
         start_time=start_time,
         end_time=end_time
@@ -38,7 +53,7 @@ def modify_meeting_time(
     return event
 
 
-def update_meeting_details(
+async def update_meeting_details(
     ctx: RunContext[CalendarDeps],
     event_id: str,
     title: Optional[str] = None,
@@ -57,7 +72,8 @@ def update_meeting_details(
     Returns:
         Updated event details
     """
-    event = ctx.deps.calendar_service.update_event(
+    event = await asyncio.to_thread(
+        ctx.deps.calendar_service.update_event,
         event_id=event_id,
         summary=title,
         description=description,
@@ -66,3 +82,51 @@ def update_meeting_details(
     
     return event
 
+
+async def update_meetings_batch(
+    ctx: RunContext[CalendarDeps],
+    updates: List[MeetingUpdate]
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Update several existing calendar meetings in one batched request
+    
+    Args:
+        updates: List of updates, each a dict with:
+            - event_id: The Google Calendar event ID
+            - start_time: Optional new start time in ISO format (YYYY-MM-DDTHH:MM:SS)
+            - end_time: Optional new end time in ISO format (YYYY-MM-DDTHH:MM:SS)
+            - title: Optional new meeting title
+            - description: Optional new meeting description
+            - location: Optional new meeting location
+            - reminder_minutes: Optional list of reminder times in minutes before the event
+    
+    Returns:
+        Updated event details for each update in the same order (None if that update failed)
+    
+    Example:
+        update_meetings_batch(updates=[
+            {"event_id": "abc123", "start_time": "2024-03-20T17:00:00", "end_time": "2024-03-20T17:15:00"},
+            {"event_id": "def456", "start_time": "2024-03-21T17:00:00", "end_time": "2024-03-21T17:15:00"}
+        ])
+    
+    Use this instead of calling modify_meeting_time, update_meeting_details or
+    configure_event_notifications repeatedly when changing more than one event.
+    """
+    requests = [
+        {
+            'event_id': update['event_id'],
+            'summary': update.get('title'),
+            'start_time': update.get('start_time'),
+            'end_time': update.get('end_time'),
+            'description': update.get('description'),
+            'location': update.get('location'),
+            'reminders': update.get('reminder_minutes')
+        }
+        for update in updates
+    ]
+    events = await asyncio.to_thread(
+        ctx.deps.calendar_service.batch_update_events,
+        requests
+    )
+    
+    return events
@@ -1,11 +1,26 @@
 """Update RSVP status for calendar events tool"""
 
+import asyncio
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from pydantic_ai import RunContext
 from .core import CalendarDeps
 
 
-def update_rsvp_status(
+# Normalize status to API values (read-only, shared by every call)
+STATUS_MAPPING = MappingProxyType({
+    'going': 'accepted',
+    'accepted': 'accepted',
+    'not going': 'declined',
+    'declined': 'declined',
+    'maybe': 'tentative',
+    'tentative': 'tentative',
+    'needsAction': 'needsAction',
+    'no response': 'needsAction'
+})
+
+
+async def update_rsvp_status(
     ctx: RunContext[CalendarDeps],
     event_id: str,
     status: str,
@@ -36,21 +51,10 @@ def update_rsvp_status(
         # Decline an event
         update_rsvp_status(event_id="abc123", status="declined")
     """
-    # Normalize status to API values
-    status_mapping = {
-        'going': 'accepted',
-        'accepted': 'accepted',
-        'not going': 'declined',
-        'declined': 'declined',
-        'maybe': 'tentative',
-        'tentative': 'tentative',
-        'needsAction': 'needsAction',
-        'no response': 'needsAction'
-    }
-    
-    normalized_status = status_mapping.get(status.lower(), status)
+    normalized_status = STATUS_MAPPING.get(status.lower(), status)
     
-    event = ctx.deps.calendar_service.update_rsvp_status(
+    event = await asyncio.to_thread(
+        ctx.deps.calendar_service.update_rsvp_status,
         event_id=event_id,
         response_status=normalized_status,
         attendee_email=attendee_email
@@ -1,11 +1,12 @@
 """Email database tool: add_email_to_database"""
 
+import asyncio
 from typing import Optional
 from pydantic_ai import RunContext
-from tinydb import Query
 from datetime import datetime
 from tools.gmail_tools.core import GmailDeps
-from tools.database_tools.db import get_db
+from tools.database_tools.db import get_db, index_contact, find_ids_by_email, find_ids_by_name, DB_LOCK
+from tools.database_tools.query_database import clear_query_cache
 
 
 async def add_email_to_database(
@@ -27,28 +28,38 @@ async def add_email_to_database(
     Returns:
         Confirmation message
     """
+    # The write is flushed to disk; keep it off the event loop
+    message = await asyncio.to_thread(_save_contact, name, email, notes)
+
+    clear_query_cache()
+    return message
+
+
+def _save_contact(name: str, email: str, notes: Optional[str]) -> str:
+    """Insert or update a contact and return the confirmation message"""
     db = get_db()
-    Contact = Query()
-    
-    # Check if contact already exists
-    existing = db.search((Contact.email == email.lower()) | (Contact.name == name))
-    
-    contact_data = {
-        'name': name,
-        'email': email.lower(),
-        'notes': notes or '',
-        'last_updated': datetime.now().isoformat()
-    }
-    
-    if existing:
-        # Update existing contact
-        db.update(contact_data, Contact.email == email.lower())
-        message = f"Updated contact: {name} ({email})"
-    else:
+    email_lower = email.lower()
+
+    with DB_LOCK:
+        # Check if contact already exists (index lookups instead of a table scan)
+        same_email = find_ids_by_email(email_lower)
+        existing = same_email or find_ids_by_name(name)
+
+        contact_data = {
+            'name': name,
+            'email': email_lower,
+            'notes': notes or '',
+            'last_updated': datetime.now().isoformat()
+        }
+
+        if existing:
+            # Update existing contact
+            if same_email:
+                for doc_id in db.update(contact_data, doc_ids=list(same_email)):
+                    index_contact(doc_id, name, email_lower)
+            return f"Updated contact: {name} ({email})"
+
         # Add new contact
         contact_data['added_date'] = datetime.now().isoformat()
-        db.insert(contact_data)
-        message = f"Added new contact: {name} ({email})"
-    
-    db.close()
-    return message
+        index_contact(db.insert(contact_data), name, email_lower)
+        return f"Added new contact: {name} ({email})"
@@ -1,9 +1,30 @@
 """Email database tool: check_if_human_sender"""
 
+import re
+from functools import lru_cache
 from pydantic_ai import RunContext
-from tinydb import Query
 from tools.gmail_tools.core import GmailDeps
-from tools.database_tools.db import get_db
+
+
+# Common automated/no-reply patterns
+AUTOMATED_PATTERNS = [
+    'noreply', 'no-reply', 'donotreply', 'do-not-reply',
+    'notification', 'notifications', 'automated', 'auto-reply',
+    'mailer-daemon', 'postmaster', 'bounces', 'newsletter',
+    'updates', 'alerts', 'support@', 'help@', 'info@',
+    'marketing@', 'news@', 'robot@'
+]
+
+# Common automated domains
+AUTOMATED_DOMAINS = [
+    'noreply.', 'notifications.', 'updates.',
+    'mail.google.com', 'facebookmail.com', 'linkedin.com',
+    'github.com', 'amazonses.com'
+]
+
+# Each list compiled into a single alternation, matched once per address
+_AUTOMATED_PATTERN_RE = re.compile('|'.join(map(re.escape, AUTOMATED_PATTERNS)))
+_AUTOMATED_DOMAIN_RE = re.compile('|'.join(map(re.escape, AUTOMATED_DOMAINS)))
 
 
 async def check_if_human_sender(ctx: RunContext[GmailDeps], email_address: str) -> str:
@@ -21,33 +42,23 @@ async def check_if_human_sender(ctx: RunContext[GmailDeps], email_address: str)
     Returns:
         Assessment of whether this appears to be a human sender
     """
-    email_lower = email_address.lower()
-    
-    # Common automated/no-reply patterns
-    automated_patterns = [
-        'noreply', 'no-reply', 'donotreply', 'do-not-reply',
-        'notification', 'notifications', 'automated', 'auto-reply',
-        'mailer-daemon', 'postmaster', 'bounces', 'newsletter',
-        'updates', 'alerts', 'support@', 'help@', 'info@',
-        'marketing@', 'news@', 'robot@'
-    ]
-    
-    # Common automated domains
-    automated_domains = [
-        'noreply.', 'notifications.', 'updates.',
-        'mail.google.com', 'facebookmail.com', 'linkedin.com',
-        'github.com', 'notifications.', 'amazonses.com'
-    ]
-    
-    # Check for automated patterns
-    for pattern in automated_patterns:
-        if pattern in email_lower:
-            return f"'{email_address}' appears to be AUTOMATED (pattern: {pattern}). Not recommended to add to database."
+    return _classify_sender(email_address)
+
+
+@lru_cache(maxsize=2048)
+def _classify_sender(email_address: str) -> str:
+    """Pure classification behind check_if_human_sender, cached per address"""
+    # Stored contacts are already lowercase; skip the copy for those
+    email_lower = email_address if email_address.islower() else email_address.lower()
     
-    # Check for automated domains
-    for domain in automated_domains:
-        if domain in email_lower:
-            return f"'{email_address}' appears to be AUTOMATED (domain: {domain}). Not recommended to add to database."
+    # One C-level scan per list instead of a Python loop over every pattern
+    match = _AUTOMATED_PATTERN_RE.search(email_lower)
+    if match:
+        return f"'{email_address}' appears to be AUTOMATED (pattern: {match.group(0)}). Not recommended to add to database."
+
+    match = _AUTOMATED_DOMAIN_RE.search(email_lower)
+    if match:
+        return f"'{email_address}' appears to be AUTOMATED (domain: {match.group(0)}). Not recommended to add to database."
     
     # Looks like a human
     return f"'{email_address}' appears to be from a HUMAN. Safe to add to database."
@@ -1,13 +1,121 @@
 """Shared database utilities for email contacts"""
 
 import os
+import atexit
+import threading
+from collections import defaultdict
+from typing import Dict, Set
 from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import JSONStorage
 
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'email_contacts.json')
 os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 
+# Process-wide database, opened on first use
+_DB = None
+_LOCK = threading.Lock()
+
+# Held around every read or write once tools run database work in worker threads
+DB_LOCK = threading.Lock()
+
+# Name index: every prefix of every lowercased name token -> contact doc_ids,
+# plus doc_id -> indexed name so entries can be dropped without a DB read
+_INDEX: Dict[str, Set[int]] = defaultdict(set)
+_INDEXED_NAMES: Dict[int, str] = {}
+
+# Email index: stored (lowercased) email -> contact doc_ids, and the reverse
+_EMAIL_INDEX: Dict[str, Set[int]] = defaultdict(set)
+_INDEXED_EMAILS: Dict[int, str] = {}
+
+# Bumped on every index change, so callers can tell when contacts were modified
+_VERSION = 0
+
 
 def get_db():
-    """Get database instance"""
-    return TinyDB(DB_PATH)
+    """
+    Get the shared database instance
+
+    The JSON file is parsed once and then served from memory. Every write is
+    still flushed to disk immediately, so callers must not close the instance.
+    """
+    global _DB
+    if _DB is None:
+        with _LOCK:
+            if _DB is None:
+                storage = CachingMiddleware(JSONStorage)
+                storage.WRITE_CACHE_SIZE = 1  # flush on every write
+                db = TinyDB(DB_PATH, storage=storage)
+                for contact in db.all():
+                    index_contact(contact.doc_id, contact.get('name', ''), contact.get('email', ''))
+                atexit.register(db.close)
+                _DB = db
+    return _DB
+
+
+def index_contact(doc_id: int, name: str, email: str) -> None:
+    """Add (or re-add under a new name or email) a contact to the indexes"""
+    global _VERSION
+    unindex_contact(doc_id)
+    _VERSION += 1
+    _INDEXED_NAMES[doc_id] = name
+    _INDEXED_EMAILS[doc_id] = email
+    _EMAIL_INDEX[email].add(doc_id)
+    for token in name.lower().split():
+        for end in range(1, len(token) + 1):
+            _INDEX[token[:end]].add(doc_id)
+
+
+def unindex_contact(doc_id: int) -> None:
+    """Remove a contact from the indexes"""
+    global _VERSION
+    _VERSION += 1
+    email = _INDEXED_EMAILS.pop(doc_id, None)
+    if email is not None:
+        ids = _EMAIL_INDEX[email]
+        ids.discard(doc_id)
+        if not ids:
+            del _EMAIL_INDEX[email]
+
+    name = _INDEXED_NAMES.pop(doc_id, None)
+    if name is None:
+        return
+    for token in name.lower().split():
+        for end in range(1, len(token) + 1):
+            ids = _INDEX.get(token[:end])
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del _INDEX[token[:end]]
+
+
+def contacts_version() -> int:
+    """Current contacts version; it changes whenever a contact is added, updated or removed"""
+    return _VERSION
+
+
+def find_contact_ids(person_name: str) -> Set[int]:
+    """
+    Find contacts whose name has a word starting with each word of person_name
+
+    "john", "Smi" and "john s" all match "John Smith". Call get_db() first so
+    the index is built.
+    """
+    tokens = person_name.lower().split()
+    if not tokens:
+        return set(_INDEXED_NAMES)
+    ids = set(_INDEX.get(tokens[0], ()))
+    for token in tokens[1:]:
+        ids &= _INDEX.get(token, set())
+    return ids
+
+
+def find_ids_by_email(email: str) -> Set[int]:
+    """Find contacts stored under exactly this (lowercased) email"""
+    return set(_EMAIL_INDEX.get(email, ()))
+
+
+def find_ids_by_name(name: str) -> Set[int]:
+    """Find contacts stored under exactly this name"""
+    return {doc_id for doc_id in find_contact_ids(name) if _INDEXED_NAMES[doc_id] == name}
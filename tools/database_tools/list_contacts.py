@@ -1,10 +1,21 @@
 """Email database tool: list_all_contacts"""
 
-from typing import List
+import asyncio
+from typing import List, Optional, Tuple
 from pydantic_ai import RunContext
-from tinydb import Query
 from tools.gmail_tools.core import GmailDeps
-from tools.database_tools.db import get_db
+from tools.database_tools.db import get_db, contacts_version, DB_LOCK
+
+
+# (contacts version, rendered listing) from the last call
+_CACHED_LIST: Optional[Tuple[int, str]] = None
+
+
+def _read_contacts() -> Tuple[int, List[dict]]:
+    """Read every contact together with the contacts version they belong to"""
+    db = get_db()
+    with DB_LOCK:
+        return contacts_version(), db.all()
 
 
 async def list_all_contacts(ctx: RunContext[GmailDeps]) -> str:
@@ -14,25 +25,27 @@ async def list_all_contacts(ctx: RunContext[GmailDeps]) -> str:
     Returns:
         List of all saved contacts
     """
-    db = get_db()
-    contacts = db.all()
+    global _CACHED_LIST
+    if _CACHED_LIST and _CACHED_LIST[0] == contacts_version():
+        return _CACHED_LIST[1]
+
+    # The first call loads the JSON file; keep that off the event loop
+    version, contacts = await asyncio.to_thread(_read_contacts)
     
     if not contacts:
-        db.close()
         return "No contacts in database yet. Add contacts using add_email_to_database."
     
     # Sort by name
     contacts.sort(key=lambda x: x.get('name', '').lower())
     
-    response = [f"\nEmail Database - {len(contacts)} contact(s):", "=" * 60]
-    
-    for i, contact in enumerate(contacts, 1):
-        response.append(f"\n{i}. {contact['name']}")
-        response.append(f"   Email: {contact['email']}")
-        if contact.get('notes'):
-            response.append(f"   Notes: {contact['notes']}")
+    separator = "=" * 60
+    lines = [
+        f"\n{i}. {contact['name']}\n   Email: {contact['email']}"
+        + (f"\n   Notes: {contact['notes']}" if contact.get('notes') else "")
+        for i, contact in enumerate(contacts, 1)
+    ]
     
-    response.append("\n" + "=" * 60)
+    response = [f"\nEmail Database - {len(contacts)} contact(s):", separator, *lines, "\n" + separator]
     
-    db.close()
-    return "\n".join(response)
+    _CACHED_LIST = (version, "\n".join(response))
+    return _CACHED_LIST[1]
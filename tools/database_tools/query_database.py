@@ -1,9 +1,31 @@
 """Email database tool: query_email_database"""
 
+import asyncio
+import time
+from typing import Dict, List, Tuple
 from pydantic_ai import RunContext
-from tinydb import Query
 from tools.gmail_tools.core import GmailDeps
-from tools.database_tools.db import get_db
+from tools.database_tools.db import get_db, find_contact_ids, contacts_version, DB_LOCK
+
+
+# Matches per lowercased name, kept for a few minutes since agents tend to
+# look up the same handful of people repeatedly within a session
+QUERY_CACHE_TTL_SECONDS = 420
+QUERY_CACHE_MAX_SIZE = 256
+_QUERY_CACHE: Dict[str, Tuple[float, List[dict]]] = {}
+
+
+def clear_query_cache() -> None:
+    """Forget cached lookups; call after any change to the contacts"""
+    _QUERY_CACHE.clear()
+
+
+def _find_contacts(person_name: str) -> Tuple[int, List[dict]]:
+    """Look the name up in the in-memory word-prefix index (case-insensitive)"""
+    db = get_db()
+    with DB_LOCK:
+        results = [db.get(doc_id=doc_id) for doc_id in sorted(find_contact_ids(person_name))]
+        return contacts_version(), results
 
 
 async def query_email_database(ctx: RunContext[GmailDeps], person_name: str) -> str:
@@ -18,27 +40,34 @@ async def query_email_database(ctx: RunContext[GmailDeps], person_name: str) ->
     Returns:
         Email address(es) from the database if found, otherwise a message to use find_email_address
     """
-    db = get_db()
-    Contact = Query()
-    
-    # Search for contacts matching the name (case-insensitive partial match)
-    results = db.search(Contact.name.search(person_name, flags=2))  # flags=2 for case-insensitive
+    key = person_name.lower()
+    cached = _QUERY_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < QUERY_CACHE_TTL_SECONDS:
+        results = cached[1]
+    else:
+        # The first call loads the JSON file; keep that off the event loop
+        version, results = await asyncio.to_thread(_find_contacts, person_name)
+
+        # Skip caching if a write landed while the lookup was running
+        if version == contacts_version():
+            if len(_QUERY_CACHE) >= QUERY_CACHE_MAX_SIZE:
+                # Evict the oldest entry
+                _QUERY_CACHE.pop(next(iter(_QUERY_CACHE)))
+            _QUERY_CACHE[key] = (time.monotonic(), results)
     
     if not results:
         return f"No contact found in database for '{person_name}'. Use find_email_address to search email history."
     
     # Format results
-    response = [f"\nFound {len(results)} contact(s) in database for '{person_name}':", "=" * 60]
-    
-    for contact in results:
-        response.append(f"\n  {contact['email']}")
-        response.append(f"   Name: {contact['name']}")
-        response.append(f"   Added: {contact.get('added_date', 'Unknown')}")
-        response.append(f"   Last updated: {contact.get('last_updated', 'Unknown')}")
-        if contact.get('notes'):
-            response.append(f"   Notes: {contact['notes']}")
+    separator = "=" * 60
+    lines = [
+        f"\n  {contact['email']}\n   Name: {contact['name']}"
+        f"\n   Added: {contact.get('added_date', 'Unknown')}"
+        f"\n   Last updated: {contact.get('last_updated', 'Unknown')}"
+        + (f"\n   Notes: {contact['notes']}" if contact.get('notes') else "")
+        for contact in results
+    ]
     
-    response.append("\n" + "=" * 60)
+    response = [f"\nFound {len(results)} contact(s) in database for '{person_name}':", separator, *lines, "\n" + separator]
     
-    db.close()
     return "\n".join(response)
@@ -1,9 +1,11 @@
 """Email database tool: remove_contact_from_database"""
 
+import asyncio
+from typing import List
 from pydantic_ai import RunContext
-from tinydb import Query
 from tools.gmail_tools.core import GmailDeps
-from tools.database_tools.db import get_db
+from tools.database_tools.db import get_db, unindex_contact, find_ids_by_email, DB_LOCK
+from tools.database_tools.query_database import clear_query_cache
 
 
 async def remove_contact_from_database(ctx: RunContext[GmailDeps], email: str) -> str:
@@ -16,13 +18,22 @@ async def remove_contact_from_database(ctx: RunContext[GmailDeps], email: str) -
     Returns:
         Confirmation message
     """
-    db = get_db()
-    Contact = Query()
-    
-    removed = db.remove(Contact.email == email.lower())
-    db.close()
+    # The write is flushed to disk; keep it off the event loop
+    removed = await asyncio.to_thread(_remove_contact, email)
+    clear_query_cache()
     
     if removed:
         return f"Removed {email} from database"
     else:
         return f"Contact {email} not found in database"
+
+
+def _remove_contact(email: str) -> List[int]:
+    """Remove every contact stored under this email and return their doc_ids"""
+    db = get_db()
+    with DB_LOCK:
+        doc_ids = find_ids_by_email(email.lower())
+        removed = db.remove(doc_ids=list(doc_ids)) if doc_ids else []
+        for doc_id in removed:
+            unindex_contact(doc_id)
+    return removed
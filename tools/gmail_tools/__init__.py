@@ -10,18 +10,18 @@ from tools.gmail_tools.search_emails import search_emails
 from tools.gmail_tools.read_email import read_email
 
 # Modification tools
-from tools.gmail_tools.mark_read import mark_email_as_read
-from tools.gmail_tools.mark_unread import mark_email_as_unread
-from tools.gmail_tools.archive_email import archive_email
-from tools.gmail_tools.trash_email import trash_email
-from tools.gmail_tools.delete_email import delete_email
+from tools.gmail_tools.mark_read import mark_email_as_read, mark_emails_as_read
+from tools.gmail_tools.mark_unread import mark_email_as_unread, mark_emails_as_unread
+from tools.gmail_tools.archive_email import archive_email, archive_emails
+from tools.gmail_tools.trash_email import trash_email, trash_emails
+from tools.gmail_tools.delete_email import delete_email, delete_emails
 
 # Label management tools
 from tools.gmail_tools.get_labels import get_labels
 from tools.gmail_tools.create_label import create_label
 from tools.gmail_tools.delete_label import delete_label
-from tools.gmail_tools.add_label import add_label_to_email
-from tools.gmail_tools.remove_label import remove_label_from_email
+from tools.gmail_tools.add_label import add_label_to_email, add_label_to_emails
+from tools.gmail_tools.remove_label import remove_label_from_email, remove_label_from_emails
 
 # Composition tools
 from tools.gmail_tools.send_email import send_email
@@ -48,16 +48,23 @@ __all__ = [
     'read_email',
     # Modification
     'mark_email_as_read',
+    'mark_emails_as_read',
     'mark_email_as_unread',
+    'mark_emails_as_unread',
     'archive_email',
+    'archive_emails',
     'trash_email',
+    'trash_emails',
     'delete_email',
+    'delete_emails',
     # Labels
     'get_labels',
     'create_label',
     'delete_label',
     'add_label_to_email',
+    'add_label_to_emails',
     'remove_label_from_email',
+    'remove_label_from_emails',
     # Composition
     'send_email',
     'reply_to_email',
@@ -1,18 +1,32 @@
 """Core Gmail API service layer - GmailTools class and dependencies"""
 
 import os
-import pickle
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import logging
+import base64
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from email.mime.text import MIMEText
+from typing import List, Optional, Dict, Any, Set, Tuple, TYPE_CHECKING
 from pathlib import Path
 from dataclasses import dataclass
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+# HttpError is cheap and caught everywhere; the auth, discovery and transport
+# modules are imported on first use so importing the tools stays fast
 from googleapiclient.errors import HttpError
 
+if TYPE_CHECKING:
+    import google_auth_httplib2
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.http import HttpRequest
+
+
+logger = logging.getLogger(__name__)
+
 
 # Gmail API scopes - includes full Gmail access for all operations including deletion
 SCOPES = [
@@ -22,6 +36,144 @@ SCOPES = [
     'https://mail.google.com/'                         # Full Gmail access (includes permanent deletion)
 ]
 
+# Authenticated (credentials, service) per (credentials_path, token_path), so
+# every GmailTools after the first skips the token load and service build
+_SERVICE_CACHE: Dict[Tuple[str, str], Tuple['Credentials', Any]] = {}
+_SERVICE_LOCK = threading.Lock()
+
+# Gmail accepts up to 100 calls per batch, but large batches trip its
+# concurrent-request rate limit; 50 keeps batched fetches reliable
+BATCH_LIMIT = 50
+
+# Backoff before each retry of requests Gmail rejected with 429 (jittered +/-50%)
+RETRY_DELAYS = (0.5, 1.0, 2.0)
+
+# Most ids messages.batchModify / messages.batchDelete accept per call
+BULK_MODIFY_LIMIT = 1000
+# Bulk chunks sent at once; more concurrent calls per user trip Gmail's 429s
+BULK_CONCURRENCY = 4
+
+
+# Headers read when listing messages; list views never show the body
+LIST_HEADERS = ['From', 'Subject', 'Date']
+
+# Partial response for full fetches: only what _parse_message reads (nested
+# parts keep just mimeType and body data; the innermost level is returned whole)
+FULL_MESSAGE_FIELDS = (
+    'id,threadId,snippet,labelIds,internalDate,'
+    'payload(headers(name,value),body/data,'
+    'parts(mimeType,body/data,parts(mimeType,body/data,parts)))'
+)
+
+
+# Parsed messages are kept this long; only their labels can change, and every
+# label change made through GmailTools drops the cached copy
+MESSAGE_CACHE_TTL_SECONDS = 300.0
+MESSAGE_CACHE_MAX_SIZE = 512
+# Searches whose results are kept (see search_emails(cache_results=True))
+SEARCH_CACHE_MAX_SIZE = 64
+
+# How long get_email waits for an in-flight body prefetch before fetching itself
+PREFETCH_WAIT_SECONDS = 10.0
+
+# Label lookups by name reuse one labels.list call for this long; labels
+# created or deleted through GmailTools refresh it immediately
+LABEL_CACHE_TTL_SECONDS = 600.0
+
+
+def _header_lookup(*names: str) -> Dict[str, str]:
+    """Map lowercased header names to the spelling _extract_headers returns them under"""
+    return {name.lower(): name for name in names}
+
+
+# Headers read from fetched messages, replies and unsubscribe checks
+_MESSAGE_HEADERS = _header_lookup('From', 'Subject', 'Date')
+_REPLY_HEADERS = _header_lookup('From', 'Subject', 'Message-ID')
+_UNSUBSCRIBE_HEADERS = _header_lookup('list-unsubscribe', 'list-unsubscribe-post')
+
+
+def _extract_headers(headers: List[dict], wanted: Dict[str, str]) -> Dict[str, str]:
+    """
+    Pick the wanted headers out of a Gmail header list in a single pass
+
+    Header names are matched case-insensitively, and the scan stops as soon as
+    every wanted header has been seen instead of walking the Received/DKIM/X-*
+    headers that follow.
+    """
+    found = {}
+    for header in headers:
+        name = wanted.get(header['name'].lower())
+        if name is not None and name not in found:
+            found[name] = header['value']
+            if len(found) == len(wanted):
+                break
+    return found
+
+
+# Query operators that are exactly a system label filter. in:trash / in:spam are
+# left to the query parser because labelIds alone skips spam and trash messages
+_QUERY_LABELS = {
+    'is:unread': 'UNREAD',
+    'is:starred': 'STARRED',
+    'is:important': 'IMPORTANT',
+    'in:inbox': 'INBOX',
+    'in:sent': 'SENT',
+}
+
+
+def _query_to_labels(query: str) -> Optional[List[str]]:
+    """Label IDs equivalent to a query made only of _QUERY_LABELS operators, else None"""
+    labels = []
+    for token in query.lower().split():
+        label = _QUERY_LABELS.get(token)
+        if label is None:
+            return None
+        labels.append(label)
+    return labels or None
+
+
+def _encode_message(headers: Dict[str, str], body: str) -> str:
+    """
+    Build a plain-text RFC 5322 message and return it base64url-encoded for the API
+
+    Messages whose headers are all ASCII and fit on one 78-character line
+    (the usual case) are assembled as bytes directly, skipping MIMEText's
+    generator; anything else still goes through MIMEText so long headers are
+    folded and non-ASCII ones get RFC 2047 encoding. CR and LF in header
+    values are replaced so a value cannot inject extra headers.
+    """
+    headers = {
+        name: value.replace('\r', ' ').replace('\n', ' ')
+        for name, value in headers.items()
+    }
+
+    if not all(value.isascii() and len(name) + len(value) + 2 <= 78 for name, value in headers.items()):
+        message = MIMEText(body)
+        for name, value in headers.items():
+            message[name] = value
+        return base64.urlsafe_b64encode(message.as_bytes()).decode()
+
+    # Same content headers and line endings MIMEText produces
+    if body.isascii():
+        content_headers = 'Content-Type: text/plain; charset="us-ascii"\nMIME-Version: 1.0\nContent-Transfer-Encoding: 7bit\n'
+        encoded_body = body.encode('ascii')
+    else:
+        content_headers = 'Content-Type: text/plain; charset="utf-8"\nMIME-Version: 1.0\nContent-Transfer-Encoding: base64\n'
+        encoded_body = base64.encodebytes(body.encode('utf-8'))
+
+    header_block = content_headers + ''.join(f"{name}: {value}\n" for name, value in headers.items())
+    return base64.urlsafe_b64encode(header_block.encode('ascii') + b'\n' + encoded_body).decode()
+
+
+def _decode_body(data: str) -> str:
+    """Decode a base64url body part to text"""
+    return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an API error is Gmail's 429 Too Many Requests"""
+    return getattr(getattr(error, 'resp', None), 'status', None) == 429
+
 
 @dataclass
 class GmailDeps:
@@ -30,13 +182,48 @@ class GmailDeps:
     gmail_service: 'GmailTools'
 
 
+def lookup_email(emails: List[dict], email_number: int) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Get an email by its number in the most recent list
+
+    Returns:
+        (email, error) where error is a message for the user if the number is invalid
+    """
+    if not emails:
+        return None, "No emails in context. Please list emails first."
+    if email_number < 1 or email_number > len(emails):
+        return None, f"Invalid email number. Please choose between 1 and {len(emails)}."
+    return emails[email_number - 1], None
+
+
+def resolve_email_numbers(emails: List[dict], email_numbers: List[int]) -> Tuple[List[str], Optional[str]]:
+    """
+    Map email numbers from the most recent list to message IDs
+
+    Returns:
+        (email_ids, error) where error is a message for the user if any number is invalid
+    """
+    if not emails:
+        return [], "No emails in context. Please list emails first."
+    if not email_numbers:
+        return [], "No email numbers given."
+
+    invalid = [number for number in email_numbers if number < 1 or number > len(emails)]
+    if invalid:
+        return [], f"Invalid email number {invalid[0]}. Please choose between 1 and {len(emails)}."
+
+    # dict.fromkeys drops repeats while keeping order
+    return list(dict.fromkeys(emails[number - 1]['id'] for number in email_numbers)), None
+
+
 class GmailTools:
     """Gmail API client for reading and modifying emails"""
 
     def __init__(
         self,
         credentials_path: Optional[str] = None,
-        token_path: Optional[str] = None
+        token_path: Optional[str] = None,
+        cache_ttl: float = MESSAGE_CACHE_TTL_SECONDS
     ):
         self.credentials_path = credentials_path or os.getenv(
             'GOOGLE_CREDENTIALS_PATH',
@@ -47,16 +234,56 @@ class GmailTools:
             'config/google_token.json'
         )
         self.service = None
-        self.authenticate()
+        self._msgs = None
+        self._labels = None
+        self._drafts = None
+
+        # Parsed messages keyed by (message id, 'full' or 'metadata')
+        self.cache_ttl = cache_ttl
+        self._message_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        # The caches are written from the prefetch thread and tool worker threads
+        self._cache_lock = threading.Lock()
+        # Message id -> event set once its background body prefetch finishes
+        self._prefetching: Dict[str, threading.Event] = {}
+        # Ids invalidated while their prefetch was running; its result is dropped
+        self._stale_prefetches: Set[str] = set()
+        # (query, max_results) -> (time, emails) for searches made with cache_results
+        self._search_cache: Dict[Tuple[str, int], Tuple[float, List[Dict[str, Any]]]] = {}
+        # Labels from the last labels.list call, and upper-cased name/id -> label id
+        self._label_list: List[Dict[str, str]] = []
+        self._label_ids: Dict[str, str] = {}
+        self._labels_fetched_at: Optional[float] = None
+        self._credentials = None
+        self._local = threading.local()
+        # One long-lived worker lists the next page during list_emails, so its
+        # thread-local keep-alive transport is reused across pages and calls
+        self._page_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gmail-pages')
+
+        key = (self.credentials_path, self.token_path)
+        with _SERVICE_LOCK:
+            cached = _SERVICE_CACHE.get(key)
+            if cached:
+                self._credentials, self.service = cached
+                self._bind_collections()
+            else:
+                self.authenticate()
 
     def authenticate(self) -> None:
         """Authenticate with Gmail API"""
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+
         creds = None
 
-        # Load existing token
+        # Load existing token (tokens saved in the old pickle format fail to
+        # parse and fall through to a fresh sign-in that rewrites them as JSON)
         if Path(self.token_path).exists():
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
+            try:
+                creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
+            except (ValueError, UnicodeDecodeError):
+                creds = None
 
         # Refresh or create new credentials
         if not creds or not creds.valid:
@@ -77,16 +304,59 @@ class GmailTools:
 
             # Save credentials
             Path(self.token_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(creds, token)
+            with open(self.token_path, 'w') as token:
+                token.write(creds.to_json())
+
+        self._credentials = creds
+        # Use the discovery document bundled with the client library instead of
+        # fetching it, and skip the on-disk discovery cache
+        self.service = build(
+            'gmail',
+            'v1',
+            http=self._authorized_http(),
+            requestBuilder=self._build_request,
+            cache_discovery=False,
+            static_discovery=True
+        )
+        _SERVICE_CACHE[(self.credentials_path, self.token_path)] = (creds, self.service)
+        self._bind_collections()
 
-        self.service = build('gmail', 'v1', credentials=creds)
+    def _bind_collections(self) -> None:
+        """Create the messages/labels/drafts resource collections once instead of per API call"""
+        users = self.service.users()
+        self._msgs = users.messages()
+        self._labels = users.labels()
+        self._drafts = users.drafts()
+
+    def _authorized_http(self) -> 'google_auth_httplib2.AuthorizedHttp':
+        """
+        Get this thread's authorized HTTP transport, creating it on first use
+
+        httplib2 connections are not thread-safe and bodies are prefetched on a
+        background thread, so each thread keeps its own keep-alive connection
+        that is reused across all API calls made from it.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import httplib2
+            import google_auth_httplib2
+
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def _build_request(self, http, *args, **kwargs) -> 'HttpRequest':
+        """Request builder that sends every API request over the calling thread's transport"""
+        from googleapiclient.http import HttpRequest
+
+        return HttpRequest(self._authorized_http(), *args, **kwargs)
 
     def list_emails(
         self,
         max_results: int = 10,
         query: Optional[str] = None,
-        label_ids: Optional[List[str]] = None
+        label_ids: Optional[List[str]] = None,
+        prefetch_bodies: bool = True
     ) -> List[Dict[str, Any]]:
         """
         List emails from Gmail inbox
@@ -95,6 +365,8 @@ class GmailTools:
             max_results: Maximum number of emails to return (default 10)
             query: Gmail query string (e.g., "is:unread", "from:example@gmail.com")
             label_ids: List of label IDs to filter by (e.g., ["INBOX", "UNREAD"])
+            prefetch_bodies: Fetch the full messages in the background so a
+                             following get_email is served from memory
 
         Returns:
             List of email dictionaries with id, subject, from, snippet, date
@@ -109,28 +381,64 @@ class GmailTools:
                 'maxResults': max_results
             }
             
-            if query:
+            # Filter by labelIds instead of q when the query is only label operators
+            query_labels = _query_to_labels(query) if query else None
+            if query_labels:
+                label_ids = list(dict.fromkeys([*(label_ids or []), *query_labels]))
+            elif query:
                 params['q'] = query
             if label_ids:
                 params['labelIds'] = label_ids
 
-            # Get message list
-            results = self.service.users().messages().list(**params).execute()
-            messages = results.get('messages', [])
-
-            # Fetch full details for each message
-            emails = []
-            for msg in messages:
-                email_data = self.get_email(msg['id'])
-                if email_data:
-                    emails.append(email_data)
-
+            # Get message list, following nextPageToken until max_results are listed
+            emails: List[Dict[str, Any]] = []
+            results = self._msgs.list(**params).execute()
+            while True:
+                messages = results.get('messages', [])
+                page_token = results.get('nextPageToken')
+                remaining = max_results - len(emails) - len(messages)
+                if not page_token or remaining <= 0:
+                    emails.extend(self._fetch_metadata(messages))
+                    break
+
+                # List the next page on a worker thread (with its own transport)
+                # while this page's metadata is fetched
+                next_params = {**params, 'pageToken': page_token, 'maxResults': remaining}
+                next_page = self._page_executor.submit(lambda: self._msgs.list(**next_params).execute())
+                emails.extend(self._fetch_metadata(messages))
+                results = next_page.result()
+
+            if prefetch_bodies:
+                self._prefetch_bodies([email_data['id'] for email_data in emails])
             return emails
 
         except HttpError as error:
-            print(f"Error fetching emails: {error}")
+            logger.error("Error fetching emails: %s", error)
             return []
 
+    def _fetch_metadata(self, messages: List[dict]) -> List[Dict[str, Any]]:
+        """Fetch headers and snippets only, in batched requests, skipping cached messages"""
+        emails = [self._cached_message(msg['id'], 'metadata') for msg in messages]
+        missing = [index for index, email_data in enumerate(emails) if email_data is None]
+        requests = [
+            self._msgs.get(
+                userId='me',
+                id=messages[index]['id'],
+                format='metadata',
+                metadataHeaders=LIST_HEADERS
+            )
+            for index in missing
+        ]
+        responses = self._execute_batched(requests, "Error fetching email")
+
+        for index, message in zip(missing, responses):
+            if message is not None:
+                emails[index] = self._cache_message(
+                    message['id'], 'metadata', self._parse_message(message, include_body=False)
+                )
+
+        return [email_data for email_data in emails if email_data is not None]
+
     def get_email(self, email_id: str) -> Optional[Dict[str, Any]]:
         """
         Get full details of a specific email
@@ -144,74 +452,266 @@ class GmailTools:
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
 
+        # A listing may already be fetching this message in the background
+        prefetch = self._prefetching.get(email_id)
+        if prefetch:
+            prefetch.wait(PREFETCH_WAIT_SECONDS)
+
+        cached = self._cached_message(email_id, 'full')
+        if cached:
+            return cached
+
         try:
-            message = self.service.users().messages().get(
+            message = self._msgs.get(
                 userId='me',
                 id=email_id,
-                format='full'
+                format='full',
+                fields=FULL_MESSAGE_FIELDS
             ).execute()
 
-            # Parse headers
-            headers = {h['name']: h['value'] for h in message['payload']['headers']}
-            
-            # Extract sender info
-            sender = headers.get('From', '')
-            subject = headers.get('Subject', '')
-            date_str = headers.get('Date', '')
-            
-            # Parse date
-            try:
-                from email.utils import parsedate_to_datetime
-                received_at = parsedate_to_datetime(date_str)
-            except:
-                received_at = datetime.utcnow()
-
-            # Get email body
-            body = self._get_email_body(message['payload'])
-            
-            # Get snippet
-            snippet = message.get('snippet', '')
-
-            return {
-                'id': message['id'],
-                'thread_id': message.get('threadId'),
-                'subject': subject,
-                'from': sender,
-                'date': received_at.isoformat(),
-                'snippet': snippet,
-                'body': body,
-                'labels': message.get('labelIds', [])
-            }
+            return self._cache_message(email_id, 'full', self._parse_message(message))
 
         except HttpError as error:
-            print(f"Error fetching email {email_id}: {error}")
+            logger.error("Error fetching email %s: %s", email_id, error)
             return None
 
-    def _get_email_body(self, payload: dict) -> str:
-        """Extract email body from Gmail payload"""
-        import base64
+    def get_email_metadata(self, email_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the headers and snippet of a specific email, without its body
+
+        Args:
+            email_id: Gmail message ID
+
+        Returns:
+            Dictionary with email details (id, subject, from, date, snippet, etc.)
+        """
+        if not self.service:
+            raise RuntimeError("Gmail service not authenticated")
+
+        cached = self._cached_message(email_id, 'metadata')
+        if cached:
+            return cached
+
+        try:
+            message = self._msgs.get(
+                userId='me',
+                id=email_id,
+                format='metadata',
+                metadataHeaders=LIST_HEADERS
+            ).execute()
+
+            return self._cache_message(email_id, 'metadata', self._parse_message(message, include_body=False))
+
+        except HttpError as error:
+            logger.error("Error fetching email %s: %s", email_id, error)
+            return None
+
+    def _prefetch_bodies(self, email_ids: List[str]) -> None:
+        """
+        Fetch full messages into the cache on a background thread
+
+        Requests built on the thread go out over that thread's own connection
+        (see _authorized_http).
+        """
+        email_ids = [
+            email_id for email_id in email_ids
+            if email_id not in self._prefetching and self._cached_message(email_id, 'full') is None
+        ]
+        if not email_ids or self._credentials is None:
+            return
+
+        done = threading.Event()
+        with self._cache_lock:
+            for email_id in email_ids:
+                self._prefetching[email_id] = done
+
+        def prefetch():
+            try:
+                requests = [
+                    self._msgs.get(userId='me', id=email_id, format='full', fields=FULL_MESSAGE_FIELDS)
+                    for email_id in email_ids
+                ]
+                responses = self._execute_batched(requests, "Error prefetching email")
+                for email_id, message in zip(email_ids, responses):
+                    if message is not None:
+                        self._cache_message(email_id, 'full', self._parse_message(message), prefetched=True)
+            finally:
+                with self._cache_lock:
+                    for email_id in email_ids:
+                        self._prefetching.pop(email_id, None)
+                        self._stale_prefetches.discard(email_id)
+                done.set()
+
+        threading.Thread(target=prefetch, daemon=True).start()
+
+    def _cached_message(self, email_id: str, message_format: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a parsed message from the cache if it is still fresh"""
+        with self._cache_lock:
+            cached = self._message_cache.get((email_id, message_format))
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return dict(cached[1])
+        return None
+
+    def _cache_message(
+        self,
+        email_id: str,
+        message_format: str,
+        email_data: Dict[str, Any],
+        prefetched: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Store a parsed message, evicting the oldest entry when full, and return a copy
+
+        A prefetched message is not stored if it was invalidated while the
+        prefetch ran, since it may predate the change.
+        """
+        with self._cache_lock:
+            if prefetched and email_id in self._stale_prefetches:
+                return email_data
+            if len(self._message_cache) >= MESSAGE_CACHE_MAX_SIZE:
+                self._message_cache.pop(next(iter(self._message_cache)), None)
+            self._message_cache[(email_id, message_format)] = (time.monotonic(), email_data)
+        return dict(email_data)
+
+    def _invalidate_message(self, email_id: str) -> None:
+        """Drop cached copies of a message after changing its labels or removing it"""
+        with self._cache_lock:
+            if email_id in self._prefetching:
+                self._stale_prefetches.add(email_id)
+            self._message_cache.pop((email_id, 'full'), None)
+            self._message_cache.pop((email_id, 'metadata'), None)
+            self._search_cache.clear()
+
+    def _parse_message(self, message: dict, include_body: bool = True) -> Dict[str, Any]:
+        """Parse a Gmail message into a readable format; metadata-format messages need include_body=False"""
+        # Parse headers
+        headers = _extract_headers(message['payload']['headers'], _MESSAGE_HEADERS)
         
-        if 'parts' in payload:
-            for part in payload['parts']:
-                if part['mimeType'] == 'text/plain':
-                    data = part['body'].get('data', '')
-                    if data:
-                        return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-                elif part['mimeType'] == 'text/html' and not any(p['mimeType'] == 'text/plain' for p in payload['parts']):
-                    # Use HTML if no plain text available
-                    data = part['body'].get('data', '')
-                    if data:
-                        return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-        elif 'body' in payload and 'data' in payload['body']:
-            data = payload['body']['data']
-            return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-
-        return ""
+        # Extract sender info
+        sender = headers.get('From', '')
+        subject = headers.get('Subject', '')
+        
+        # Parse date from internalDate (ms since epoch, always set by Gmail),
+        # shown in the user's local timezone; the Date header is only parsed
+        # if it is missing
+        internal_date = message.get('internalDate')
+        if internal_date:
+            received_at = datetime.fromtimestamp(int(internal_date) / 1000, tz=timezone.utc).astimezone()
+        else:
+            try:
+                received_at = parsedate_to_datetime(headers.get('Date', ''))
+            except (TypeError, ValueError):
+                received_at = datetime.now(timezone.utc)
+
+        # Get snippet
+        snippet = message.get('snippet', '')
+
+        email_data = {
+            'id': message['id'],
+            'thread_id': message.get('threadId'),
+            'subject': subject,
+            'from': sender,
+            'date': received_at.isoformat(),
+            'snippet': snippet,
+            'labels': message.get('labelIds', [])
+        }
+
+        # Get email body
+        if include_body:
+            email_data['body'] = self._get_email_body(message['payload'])
+
+        return email_data
+
+    def _execute_batched(self, requests: List['HttpRequest'], error_message: str) -> List[Any]:
+        """
+        Execute API requests BATCH_LIMIT at a time instead of one round trip each
+
+        Requests rejected with 429 are retried in a fresh batch after each of
+        RETRY_DELAYS, so a rate-limit burst does not drop them.
+
+        Args:
+            requests: Unexecuted API requests
+            error_message: Prefix printed with the error of a failed request
+
+        Returns:
+            Responses in the same order as requests, with None for failures
+        """
+        responses: List[Any] = [None] * len(requests)
+        rate_limited: List[int] = []
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                if _is_rate_limited(exception):
+                    rate_limited.append(int(request_id))
+                else:
+                    logger.error("%s: %s", error_message, exception)
+                return
+            responses[int(request_id)] = response
+
+        pending = list(range(len(requests)))
+        for delay in (0.0, *RETRY_DELAYS):
+            if not pending:
+                break
+            if delay:
+                time.sleep(delay * random.uniform(0.5, 1.5))
+
+            for start in range(0, len(pending), BATCH_LIMIT):
+                chunk = pending[start:start + BATCH_LIMIT]
+                batch = self.service.new_batch_http_request(callback=on_response)
+                for index in chunk:
+                    batch.add(requests[index], request_id=str(index))
+
+                try:
+                    batch.execute()
+                except HttpError as error:
+                    if _is_rate_limited(error):
+                        rate_limited.extend(chunk)
+                    else:
+                        logger.error("%s: %s", error_message, error)
+
+            pending = rate_limited[:]
+            rate_limited.clear()
+
+        if pending:
+            logger.error(
+                "%s: %d requests still rate limited after %d retries (indices %s)",
+                error_message, len(pending), len(RETRY_DELAYS), sorted(pending)
+            )
+
+        return responses
+
+    def _get_email_body(self, payload: dict) -> str:
+        """Extract email body from Gmail payload, preferring text/plain over text/html"""
+        if 'parts' not in payload:
+            data = payload.get('body', {}).get('data')
+            return _decode_body(data) if data else ""
+
+        # Breadth-first over nested multiparts (multipart/mixed messages keep the
+        # text inside a multipart/alternative part); stop at the first text/plain
+        html_data = None
+        pending = deque(payload['parts'])
+        while pending:
+            part = pending.popleft()
+            if 'parts' in part:
+                pending.extend(part['parts'])
+                continue
+            mime_type = part.get('mimeType')
+            data = part.get('body', {}).get('data')
+            if not data:
+                continue
+            if mime_type == 'text/plain':
+                return _decode_body(data)
+            if mime_type == 'text/html' and html_data is None:
+                html_data = data
+
+        return _decode_body(html_data) if html_data else ""
 
     def search_emails(
         self,
         search_query: str,
-        max_results: int = 10
+        max_results: int = 10,
+        prefetch_bodies: bool = True,
+        cache_results: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Search emails using Gmail query syntax
@@ -219,17 +719,35 @@ class GmailTools:
         Args:
             search_query: Gmail search query (e.g., "from:example@gmail.com subject:meeting")
             max_results: Maximum number of results to return
+            prefetch_bodies: Fetch the full messages in the background (see list_emails)
+            cache_results: Reuse the results of the same search made within cache_ttl
+                           seconds; cleared whenever mail is changed or sent here
 
         Returns:
             List of matching emails
         """
-        return self.list_emails(max_results=max_results, query=search_query)
+        if not cache_results:
+            return self.list_emails(max_results=max_results, query=search_query, prefetch_bodies=prefetch_bodies)
+
+        key = (search_query, max_results)
+        with self._cache_lock:
+            cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return [dict(email_data) for email_data in cached[1]]
+
+        emails = self.list_emails(max_results=max_results, query=search_query, prefetch_bodies=prefetch_bodies)
+        # Empty results are not kept; list_emails also returns [] on API errors
+        if emails:
+            with self._cache_lock:
+                if len(self._search_cache) >= SEARCH_CACHE_MAX_SIZE:
+                    self._search_cache.pop(next(iter(self._search_cache)), None)
+                self._search_cache[key] = (time.monotonic(), [dict(email_data) for email_data in emails])
+        return emails
 
     def get_unread_emails(self, max_results: int = 10) -> List[Dict[str, Any]]:
         """Get unread emails from inbox"""
         return self.list_emails(
             max_results=max_results,
-            query="is:unread",
             label_ids=["INBOX", "UNREAD"]
         )
 
@@ -239,93 +757,216 @@ class GmailTools:
         """Mark an email as read"""
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        self._invalidate_message(email_id)
 
         try:
-            self.service.users().messages().modify(
+            self._msgs.modify(
                 userId='me',
                 id=email_id,
                 body={'removeLabelIds': ['UNREAD']}
             ).execute()
             return True
         except HttpError as error:
-            print(f"Error marking email as read: {error}")
+            logger.error("Error marking email as read: %s", error)
             return False
 
     def mark_as_unread(self, email_id: str) -> bool:
         """Mark an email as unread"""
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        self._invalidate_message(email_id)
 
         try:
-            self.service.users().messages().modify(
+            self._msgs.modify(
                 userId='me',
                 id=email_id,
                 body={'addLabelIds': ['UNREAD']}
             ).execute()
             return True
         except HttpError as error:
-            print(f"Error marking email as unread: {error}")
+            logger.error("Error marking email as unread: %s", error)
             return False
 
     def archive_email(self, email_id: str) -> bool:
         """Archive an email (remove from inbox)"""
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        self._invalidate_message(email_id)
 
         try:
-            self.service.users().messages().modify(
+            self._msgs.modify(
                 userId='me',
                 id=email_id,
                 body={'removeLabelIds': ['INBOX']}
             ).execute()
             return True
         except HttpError as error:
-            print(f"Error archiving email: {error}")
+            logger.error("Error archiving email: %s", error)
             return False
 
     def trash_email(self, email_id: str) -> bool:
         """Move an email to trash"""
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        self._invalidate_message(email_id)
 
         try:
-            self.service.users().messages().trash(
+            self._msgs.trash(
                 userId='me',
                 id=email_id
             ).execute()
             return True
         except HttpError as error:
-            print(f"Error trashing email: {error}")
+            logger.error("Error trashing email: %s", error)
             return False
 
     def delete_email(self, email_id: str) -> bool:
         """Permanently delete an email"""
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        self._invalidate_message(email_id)
 
         try:
-            self.service.users().messages().delete(
+            self._msgs.delete(
                 userId='me',
                 id=email_id
             ).execute()
             return True
         except HttpError as error:
-            print(f"Error deleting email: {error}")
+            logger.error("Error deleting email: %s", error)
             return False
 
+    # ==================== BULK MODIFICATION TOOLS ====================
+
+    def batch_modify_labels(
+        self,
+        email_ids: List[str],
+        add_label_ids: Optional[List[str]] = None,
+        remove_label_ids: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Apply one label change to many emails with messages.batchModify
+
+        One call covers up to BULK_MODIFY_LIMIT emails instead of one
+        modify round trip per email.
+
+        Args:
+            email_ids: Gmail message IDs to change
+            add_label_ids: Label IDs to add to every email
+            remove_label_ids: Label IDs to remove from every email
+
+        Returns:
+            True if every chunk was modified
+        """
+        if not self.service:
+            raise RuntimeError("Gmail service not authenticated")
+        for email_id in email_ids:
+            self._invalidate_message(email_id)
+
+        body: Dict[str, List[str]] = {}
+        if add_label_ids:
+            body['addLabelIds'] = add_label_ids
+        if remove_label_ids:
+            body['removeLabelIds'] = remove_label_ids
+
+        return self._execute_bulk('batchModify', email_ids, body, "Error modifying emails")
+
+    def batch_mark_as_read(self, email_ids: List[str]) -> bool:
+        """Mark several emails as read"""
+        return self.batch_modify_labels(email_ids, remove_label_ids=['UNREAD'])
+
+    def batch_mark_as_unread(self, email_ids: List[str]) -> bool:
+        """Mark several emails as unread"""
+        return self.batch_modify_labels(email_ids, add_label_ids=['UNREAD'])
+
+    def batch_archive(self, email_ids: List[str]) -> bool:
+        """Archive several emails (remove from inbox)"""
+        return self.batch_modify_labels(email_ids, remove_label_ids=['INBOX'])
+
+    def batch_trash(self, email_ids: List[str]) -> bool:
+        """Move several emails to trash (adding TRASH is what messages.trash does)"""
+        return self.batch_modify_labels(email_ids, add_label_ids=['TRASH'])
+
+    def batch_delete(self, email_ids: List[str]) -> bool:
+        """Permanently delete several emails with messages.batchDelete"""
+        if not self.service:
+            raise RuntimeError("Gmail service not authenticated")
+        for email_id in email_ids:
+            self._invalidate_message(email_id)
+
+        return self._execute_bulk('batchDelete', email_ids, {}, "Error deleting emails")
+
+    def _execute_bulk(self, method: str, email_ids: List[str], body: Dict[str, List[str]], error_message: str) -> bool:
+        """
+        Call messages.batchModify or messages.batchDelete over BULK_MODIFY_LIMIT-id chunks
+
+        Chunks run BULK_CONCURRENCY at a time on worker threads (each with its
+        own transport). A chunk rejected with 429 is retried on its own after
+        each of RETRY_DELAYS, so the other chunks are not resent.
+
+        Args:
+            method: 'batchModify' or 'batchDelete'
+            email_ids: Gmail message IDs to act on
+            body: Request body fields other than the ids
+            error_message: Prefix logged with the error of a failed chunk
+
+        Returns:
+            True if every chunk succeeded
+        """
+        def call(chunk: List[str]) -> bool:
+            for delay in (0.0, *RETRY_DELAYS):
+                if delay:
+                    time.sleep(delay * random.uniform(0.5, 1.5))
+                try:
+                    getattr(self._msgs, method)(userId='me', body={'ids': chunk, **body}).execute()
+                    return True
+                except HttpError as error:
+                    if not _is_rate_limited(error):
+                        logger.error("%s: %s", error_message, error)
+                        return False
+            logger.error("%s: still rate limited after %d retries", error_message, len(RETRY_DELAYS))
+            return False
+
+        chunks = [email_ids[start:start + BULK_MODIFY_LIMIT] for start in range(0, len(email_ids), BULK_MODIFY_LIMIT)]
+        if len(chunks) <= 1:
+            return all(call(chunk) for chunk in chunks)
+
+        with ThreadPoolExecutor(max_workers=BULK_CONCURRENCY) as executor:
+            results = list(executor.map(call, chunks))
+        return all(results)
+
     def get_labels(self) -> List[Dict[str, str]]:
         """Get all Gmail labels"""
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
 
         try:
-            results = self.service.users().labels().list(userId='me').execute()
-            labels = results.get('labels', [])
-            return [{'id': label['id'], 'name': label['name']} for label in labels]
+            results = self._labels.list(userId='me').execute()
+            labels = [{'id': label['id'], 'name': label['name']} for label in results.get('labels', [])]
         except HttpError as error:
-            print(f"Error fetching labels: {error}")
+            logger.error("Error fetching labels: %s", error)
             return []
 
+        label_ids: Dict[str, str] = {}
+        for label in labels:
+            label_ids.setdefault(label['name'].upper(), label['id'])
+            label_ids.setdefault(label['id'].upper(), label['id'])
+        self._label_list, self._label_ids = labels, label_ids
+        self._labels_fetched_at = time.monotonic()
+        return labels
+
+    def get_cached_labels(self) -> List[Dict[str, str]]:
+        """Get all Gmail labels, listing them again only after LABEL_CACHE_TTL_SECONDS"""
+        fetched_at = self._labels_fetched_at
+        if fetched_at is None or time.monotonic() - fetched_at >= LABEL_CACHE_TTL_SECONDS:
+            return self.get_labels()
+        return self._label_list
+
+    def find_label_id(self, label_name: str) -> Optional[str]:
+        """Resolve a label name or ID (case-insensitive) to its ID from the cached labels"""
+        self.get_cached_labels()
+        return self._label_ids.get(label_name.upper())
+
     def create_label(self, label_name: str) -> Optional[Dict[str, str]]:
         """
         Create a new Gmail label
@@ -346,14 +987,15 @@ class GmailTools:
                 'messageListVisibility': 'show'
             }
             
-            created_label = self.service.users().labels().create(
+            created_label = self._labels.create(
                 userId='me',
                 body=label_object
             ).execute()
+            self._labels_fetched_at = None
             
             return {'id': created_label['id'], 'name': created_label['name']}
         except HttpError as error:
-            print(f"Error creating label: {error}")
+            logger.error("Error creating label: %s", error)
             return None
 
     def delete_label(self, label_id: str) -> bool:
@@ -368,47 +1010,64 @@ class GmailTools:
         """
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        # Cached messages may still list the deleted label
+        with self._cache_lock:
+            self._message_cache.clear()
+            self._search_cache.clear()
+        self._labels_fetched_at = None
 
         try:
-            self.service.users().labels().delete(
+            self._labels.delete(
                 userId='me',
                 id=label_id
             ).execute()
             return True
         except HttpError as error:
-            print(f"Error deleting label: {error}")
+            logger.error("Error deleting label: %s", error)
             return False
 
     def add_label(self, email_id: str, label_id: str) -> bool:
         """Add a label to an email"""
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        self._invalidate_message(email_id)
 
         try:
-            self.service.users().messages().modify(
+            self._msgs.modify(
                 userId='me',
                 id=email_id,
                 body={'addLabelIds': [label_id]}
             ).execute()
             return True
         except HttpError as error:
-            print(f"Error adding label: {error}")
+            logger.error("Error adding label: %s", error)
             return False
 
+    def add_label_by_name(self, email_id: str, label_name: str) -> bool:
+        """Add a label to an email by name, creating the label if it does not exist"""
+        label_id = self.find_label_id(label_name)
+        if label_id is None:
+            created_label = self.create_label(label_name)
+            if created_label is None:
+                return False
+            label_id = created_label['id']
+        return self.add_label(email_id, label_id)
+
     def remove_label(self, email_id: str, label_id: str) -> bool:
         """Remove a label from an email"""
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        self._invalidate_message(email_id)
 
         try:
-            self.service.users().messages().modify(
+            self._msgs.modify(
                 userId='me',
                 id=email_id,
                 body={'removeLabelIds': [label_id]}
             ).execute()
             return True
         except HttpError as error:
-            print(f"Error removing label: {error}")
+            logger.error("Error removing label: %s", error)
             return False
 
     def create_draft(
@@ -436,28 +1095,23 @@ class GmailTools:
             raise RuntimeError("Gmail service not authenticated")
 
         try:
-            import base64
-            from email.mime.text import MIMEText
-
-            message = MIMEText(body)
-            message['to'] = to
-            message['subject'] = subject
+            headers = {'to': to, 'subject': subject}
             
             if cc:
-                message['cc'] = ', '.join(cc)
+                headers['cc'] = ', '.join(cc)
             if bcc:
-                message['bcc'] = ', '.join(bcc)
+                headers['bcc'] = ', '.join(bcc)
 
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+            raw_message = _encode_message(headers, body)
             
-            draft = self.service.users().drafts().create(
+            draft = self._drafts.create(
                 userId='me',
                 body={'message': {'raw': raw_message}}
             ).execute()
             
             return draft['id']
         except HttpError as error:
-            print(f"Error creating draft: {error}")
+            logger.error("Error creating draft: %s", error)
             return None
 
     def create_draft_reply(
@@ -479,11 +1133,8 @@ class GmailTools:
             raise RuntimeError("Gmail service not authenticated")
 
         try:
-            import base64
-            from email.mime.text import MIMEText
-            
             # Get the original email details
-            original = self.service.users().messages().get(
+            original = self._msgs.get(
                 userId='me',
                 id=email_id,
                 format='metadata',
@@ -491,7 +1142,7 @@ class GmailTools:
             ).execute()
             
             # Extract headers
-            headers = {h['name']: h['value'] for h in original['payload']['headers']}
+            headers = _extract_headers(original['payload']['headers'], _REPLY_HEADERS)
             original_from = headers.get('From', '')
             original_subject = headers.get('Subject', '')
             message_id = headers.get('Message-ID', '')
@@ -501,16 +1152,14 @@ class GmailTools:
             reply_subject = original_subject if original_subject.startswith('Re:') else f"Re: {original_subject}"
             
             # Create reply message
-            message = MIMEText(reply_body)
-            message['to'] = original_from
-            message['subject'] = reply_subject
+            reply_headers = {'to': original_from, 'subject': reply_subject}
             
             # Add threading headers
             if message_id:
-                message['In-Reply-To'] = message_id
-                message['References'] = message_id
+                reply_headers['In-Reply-To'] = message_id
+                reply_headers['References'] = message_id
             
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+            raw_message = _encode_message(reply_headers, reply_body)
             
             # Create draft with thread ID
             draft_body = {
@@ -520,14 +1169,14 @@ class GmailTools:
                 }
             }
             
-            draft = self.service.users().drafts().create(
+            draft = self._drafts.create(
                 userId='me',
                 body=draft_body
             ).execute()
             
             return draft['id']
         except HttpError as error:
-            print(f"Error creating draft reply: {error}")
+            logger.error("Error creating draft reply: %s", error)
             return None
 
     def send_email(
@@ -553,30 +1202,28 @@ class GmailTools:
         """
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        # A sent message can match cached searches
+        with self._cache_lock:
+            self._search_cache.clear()
 
         try:
-            import base64
-            from email.mime.text import MIMEText
-
-            message = MIMEText(body)
-            message['to'] = to
-            message['subject'] = subject
+            headers = {'to': to, 'subject': subject}
             
             if cc:
-                message['cc'] = ', '.join(cc)
+                headers['cc'] = ', '.join(cc)
             if bcc:
-                message['bcc'] = ', '.join(bcc)
+                headers['bcc'] = ', '.join(bcc)
 
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+            raw_message = _encode_message(headers, body)
             
-            self.service.users().messages().send(
+            self._msgs.send(
                 userId='me',
                 body={'raw': raw_message}
             ).execute()
             
             return True
         except HttpError as error:
-            print(f"Error sending email: {error}")
+            logger.error("Error sending email: %s", error)
             return False
 
     def reply_to_email(
@@ -596,6 +1243,9 @@ class GmailTools:
         """
         if not self.service:
             raise RuntimeError("Gmail service not authenticated")
+        # A sent message can match cached searches
+        with self._cache_lock:
+            self._search_cache.clear()
 
         try:
             # Get original email
@@ -603,19 +1253,18 @@ class GmailTools:
             if not original:
                 return False
 
-            import base64
-            from email.mime.text import MIMEText
-
             # Create reply
-            message = MIMEText(body)
-            message['to'] = original['from']
-            message['subject'] = f"Re: {original['subject']}"
-            message['In-Reply-To'] = email_id
-            message['References'] = email_id
-
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+            raw_message = _encode_message(
+                {
+                    'to': original['from'],
+                    'subject': f"Re: {original['subject']}",
+                    'In-Reply-To': email_id,
+                    'References': email_id
+                },
+                body
+            )
             
-            self.service.users().messages().send(
+            self._msgs.send(
                 userId='me',
                 body={
                     'raw': raw_message,
@@ -625,7 +1274,7 @@ class GmailTools:
             
             return True
         except HttpError as error:
-            print(f"Error replying to email: {error}")
+            logger.error("Error replying to email: %s", error)
             return False
 
     def get_unsubscribe_info(self, email_id: str) -> Optional[Dict[str, Any]]:
@@ -643,14 +1292,14 @@ class GmailTools:
 
         try:
             # Get email with full headers
-            message = self.service.users().messages().get(
+            message = self._msgs.get(
                 userId='me',
                 id=email_id,
                 format='full'
             ).execute()
 
             # Parse headers
-            headers = {h['name'].lower(): h['value'] for h in message['payload']['headers']}
+            headers = _extract_headers(message['payload']['headers'], _UNSUBSCRIBE_HEADERS)
             
             unsubscribe_info = {
                 'has_unsubscribe': False,
@@ -721,7 +1370,7 @@ class GmailTools:
             return unsubscribe_info if unsubscribe_info['has_unsubscribe'] else None
 
         except HttpError as error:
-            print(f"Error getting unsubscribe info: {error}")
+            logger.error("Error getting unsubscribe info: %s", error)
             return None
 
     def unsubscribe_one_click(self, url: str, post_data: str = "List-Unsubscribe=One-Click") -> bool:
@@ -750,6 +1399,6 @@ class GmailTools:
             return response.status_code < 400
             
         except Exception as error:
-            print(f"Error executing one-click unsubscribe: {error}")
+            logger.error("Error executing one-click unsubscribe: %s", error)
             return False
 
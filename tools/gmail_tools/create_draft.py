@@ -1,5 +1,6 @@
 """Gmail tool: create_draft_email"""
 
+import asyncio
 from pydantic_ai import RunContext
 from tools.gmail_tools.core import GmailDeps
 
@@ -19,7 +20,7 @@ async def create_draft_email(ctx: RunContext[GmailDeps], to: str, subject: str,
     Returns:
         Confirmation message with draft ID
     """
-    draft_id = ctx.deps.gmail_service.create_draft(to, subject, body)
+    draft_id = await asyncio.to_thread(ctx.deps.gmail_service.create_draft, to, subject, body)
     
     if draft_id:
         return f"Draft created successfully!\n\nTo: {to}\nSubject: {subject}\n\nYou can review and send this draft from Gmail. Draft ID: {draft_id}"
@@ -1,7 +1,8 @@
 """Gmail tool: create_draft_reply"""
 
+import asyncio
 from pydantic_ai import RunContext
-from tools.gmail_tools.core import GmailDeps
+from tools.gmail_tools.core import GmailDeps, lookup_email
 
 
 async def create_draft_reply(ctx: RunContext[GmailDeps], email_number: int, reply_body: str) -> str:
@@ -18,19 +19,15 @@ async def create_draft_reply(ctx: RunContext[GmailDeps], email_number: int, repl
     Returns:
         Confirmation message with draft ID
     """
-    emails = ctx.deps.emails
+    email, error = lookup_email(ctx.deps.emails, email_number)
+    if error:
+        return error
     
-    if not emails:
-        return "No emails available. Please list emails first using list_emails or search_emails."
+    email_id = email['id']
+    original_subject = email['subject']
+    original_from = email['from']
     
-    if email_number < 1 or email_number > len(emails):
-        return f"Invalid email number. Please choose between 1 and {len(emails)}."
-    
-    email_id = emails[email_number - 1]['id']
-    original_subject = emails[email_number - 1]['subject']
-    original_from = emails[email_number - 1]['from']
-    
-    draft_id = ctx.deps.gmail_service.create_draft_reply(email_id, reply_body)
+    draft_id = await asyncio.to_thread(ctx.deps.gmail_service.create_draft_reply, email_id, reply_body)
     
     if draft_id:
         return f"Draft reply created successfully!\n\nReplying to: {original_from}\nSubject: Re: {original_subject}\n\nYou can review and send this draft reply from Gmail. Draft ID: {draft_id}"
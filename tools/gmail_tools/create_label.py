@@ -1,5 +1,6 @@
 """Gmail tool: create_label"""
 
+import asyncio
 from pydantic_ai import RunContext
 from tools.gmail_tools.core import GmailDeps
 
@@ -16,7 +17,7 @@ async def create_label(ctx: RunContext[GmailDeps], label_name: str) -> str:
     Returns:
         Confirmation message with the created label details
     """
-    result = ctx.deps.gmail_service.create_label(label_name)
+    result = await asyncio.to_thread(ctx.deps.gmail_service.create_label, label_name)
     
     if result:
         return f"Label '{label_name}' created successfully! (ID: {result['id']})"
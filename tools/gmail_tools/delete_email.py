@@ -1,7 +1,9 @@
-"""Gmail tool: delete_email"""
+"""Gmail tools: delete_email, delete_emails"""
 
+import asyncio
+from typing import List
 from pydantic_ai import RunContext
-from tools.gmail_tools.core import GmailDeps
+from tools.gmail_tools.core import GmailDeps, lookup_email, resolve_email_numbers
 
 
 async def delete_email(ctx: RunContext[GmailDeps], email_number: int) -> str:
@@ -11,18 +13,35 @@ async def delete_email(ctx: RunContext[GmailDeps], email_number: int) -> str:
     Args:
         email_number: The number of the email from the most recent list
     """
-    emails = ctx.deps.emails
+    email, error = lookup_email(ctx.deps.emails, email_number)
+    if error:
+        return error
     
-    if not emails:
-        return "No emails in context. Please list emails first."
-    
-    if email_number < 1 or email_number > len(emails):
-        return f"Invalid email number. Please choose between 1 and {len(emails)}."
-    
-    email_id = emails[email_number - 1]['id']
-    success = ctx.deps.gmail_service.delete_email(email_id)
+    email_id = email['id']
+    success = await asyncio.to_thread(ctx.deps.gmail_service.delete_email, email_id)
     
     if success:
         return f"Email {email_number} permanently deleted"
     else:
         return "Failed to delete email"
+
+
+async def delete_emails(ctx: RunContext[GmailDeps], email_numbers: List[int]) -> str:
+    """
+    Permanently delete several emails in a single request. This cannot be undone!
+    
+    Use this instead of calling the single-email tool repeatedly.
+    
+    Args:
+        email_numbers: The numbers of the emails from the most recent list (e.g., [1, 2, 5])
+    """
+    email_ids, error = resolve_email_numbers(ctx.deps.emails, email_numbers)
+    if error:
+        return error
+    
+    success = await asyncio.to_thread(ctx.deps.gmail_service.batch_delete, email_ids)
+    
+    if success:
+        return f"Permanently deleted {len(email_ids)} emails"
+    else:
+        return "Failed to delete emails"
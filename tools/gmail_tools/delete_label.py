@@ -1,5 +1,6 @@
 """Gmail tool: delete_label"""
 
+import asyncio
 from pydantic_ai import RunContext
 from tools.gmail_tools.core import GmailDeps
 
@@ -17,8 +18,8 @@ async def delete_label(ctx: RunContext[GmailDeps], label_name: str) -> str:
     Returns:
         Confirmation message
     """
-    # First, get all labels to find the ID
-    labels = ctx.deps.gmail_service.get_labels()
+    # First, get all labels to find the ID (cached between label operations)
+    labels = await asyncio.to_thread(ctx.deps.gmail_service.get_cached_labels)
     
     # Find the label by name (case-insensitive)
     label_id = None
@@ -34,7 +35,7 @@ async def delete_label(ctx: RunContext[GmailDeps], label_name: str) -> str:
         return f"Label '{label_name}' not found. Available labels: {', '.join(available_labels)}"
     
     # Delete the label
-    success = ctx.deps.gmail_service.delete_label(label_id)
+    success = await asyncio.to_thread(ctx.deps.gmail_service.delete_label, label_id)
     
     if success:
         return f"Label '{actual_name}' deleted successfully!"
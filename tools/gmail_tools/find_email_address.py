@@ -1,8 +1,14 @@
 """Gmail tool: find_email_address"""
 
+import asyncio
+import re
+from collections import Counter
 from pydantic_ai import RunContext
 from tools.gmail_tools.core import GmailDeps
 
+# "Name <email@example.com>": everything before the first '<', and the address up to '>'
+_SENDER_RE = re.compile(r'([^<]*)<([^>]*)>')
+
 
 async def find_email_address(ctx: RunContext[GmailDeps], person_name: str, max_results: int = 10) -> str:
     """
@@ -18,56 +24,68 @@ async def find_email_address(ctx: RunContext[GmailDeps], person_name: str, max_r
     Returns:
         A list of email addresses found for that person with context from recent emails
     """
-    # Search for emails from this person
-    search_query = f"from:{person_name}"
-    emails = ctx.deps.gmail_service.search_emails(search_query=search_query, max_results=max_results)
+    gmail_service = ctx.deps.gmail_service
     
-    if not emails:
-        # Try searching in message body as well
-        search_query = f"{person_name}"
-        emails = ctx.deps.gmail_service.search_emails(search_query=search_query, max_results=max_results)
+    # Search for emails from this person, and speculatively search the message
+    # body at the same time; the body results are only used if the first is empty.
+    # Cancelling the task only drops its result: the worker thread cannot be
+    # interrupted, so the body search always completes (and fills the search cache)
+    body_search = asyncio.create_task(asyncio.to_thread(
+        gmail_service.search_emails,
+        search_query=f"{person_name}", max_results=max_results,
+        prefetch_bodies=False, cache_results=True
+    ))
+    try:
+        emails = await asyncio.to_thread(
+            gmail_service.search_emails,
+            search_query=f"from:{person_name}", max_results=max_results,
+            prefetch_bodies=False, cache_results=True
+        )
+        if not emails:
+            emails = await body_search
+    finally:
+        # Always retrieve the task's outcome so a failure is never left unobserved
+        body_search.cancel()
+        await asyncio.gather(body_search, return_exceptions=True)
     
     if not emails:
         return f"No emails found from or mentioning '{person_name}'. Cannot determine email address."
     
-    # Extract unique email addresses
-    email_addresses = {}
+    # Count emails per address, keeping the name and subject of the most recent one
+    address_counts = Counter()
+    first_seen = {}
+    person_lower = person_name.lower()
     for email in emails:
         sender = email.get('from', '')
         # Extract email from "Name <email@example.com>" format
-        if '<' in sender and '>' in sender:
-            email_addr = sender.split('<')[1].split('>')[0].strip().lower()
-            sender_name = sender.split('<')[0].strip()
+        match = _SENDER_RE.match(sender)
+        if match:
+            sender_name = match.group(1).strip()
+            email_addr = match.group(2).strip().lower()
         else:
-            email_addr = sender.strip().lower()
             sender_name = sender
+            email_addr = sender.strip().lower()
         
         # Check if this name matches what we're looking for
-        if person_name.lower() in sender_name.lower():
-            if email_addr not in email_addresses:
-                email_addresses[email_addr] = {
-                    'name': sender_name,
-                    'count': 0,
-                    'latest_subject': email.get('subject', 'No subject')
-                }
-            email_addresses[email_addr]['count'] += 1
+        if person_lower in sender_name.lower():
+            address_counts[email_addr] += 1
+            first_seen.setdefault(email_addr, (sender_name, email.get('subject', 'No subject')))
     
-    if not email_addresses:
+    if not address_counts:
         return f"Found emails mentioning '{person_name}', but couldn't extract their email address."
     
-    # Format results
-    result = [f"\nFound {len(email_addresses)} email address(es) for '{person_name}':", "=" * 60]
-    
-    # Sort by frequency (most emails first)
-    sorted_addresses = sorted(email_addresses.items(), key=lambda x: x[1]['count'], reverse=True)
-    
-    for email_addr, info in sorted_addresses:
-        result.append(f"\n  {email_addr}")
-        result.append(f"   Name: {info['name']}")
-        result.append(f"   Email count: {info['count']} email(s)")
-        result.append(f"   Latest: {info['latest_subject']}")
-    
-    result.append("\n" + "=" * 60)
-    result.append("\n Tip: Use the most recent/frequently used email address for this person.")
+    # Format results, sorted by frequency (most emails first)
+    separator = "=" * 60
+    entries = "\n".join(
+        f"\n  {email_addr}\n"
+        f"   Name: {first_seen[email_addr][0]}\n"
+        f"   Email count: {count} email(s)\n"
+        f"   Latest: {first_seen[email_addr][1]}"
+        for email_addr, count in address_counts.most_common()
+    )
     
-    return "\n".join(result)
+    return (
+        f"\nFound {len(address_counts)} email address(es) for '{person_name}':\n{separator}\n{entries}\n"
+        f"\n{separator}\n"
+        "\n Tip: Use the most recent/frequently used email address for this person."
+    )
@@ -1,5 +1,6 @@
 """Gmail tool: get_labels"""
 
+import asyncio
 from pydantic_ai import RunContext
 from tools.gmail_tools.core import GmailDeps
 
@@ -10,14 +11,11 @@ async def get_labels(ctx: RunContext[GmailDeps]) -> str:
     
     Returns a list of all labels in the Gmail account with their IDs and names.
     """
-    labels = ctx.deps.gmail_service.get_labels()
+    labels = await asyncio.to_thread(ctx.deps.gmail_service.get_labels)
     
     if not labels:
         return "No labels found."
     
-    result = [f"\nFound {len(labels)} labels:", "=" * 60]
-    for label in labels:
-        result.append(f"  • {label['name']} (ID: {label['id']})")
-    
-    result.append("=" * 60)
-    return "\n".join(result)
+    separator = "=" * 60
+    entries = "\n".join(f"  • {label['name']} (ID: {label['id']})" for label in labels)
+    return f"\nFound {len(labels)} labels:\n{separator}\n{entries}\n{separator}"
@@ -1,5 +1,6 @@
 """Gmail tool: list_emails"""
 
+import asyncio
 from pydantic_ai import RunContext
 from tools.gmail_tools.core import GmailDeps
 
@@ -11,7 +12,7 @@ async def list_emails(ctx: RunContext[GmailDeps], max_results: int = 10) -> str:
     Args:
         max_results: Number of emails to return (default 10, max 50)
     """
-    emails = ctx.deps.gmail_service.list_emails(max_results=max_results)
+    emails = await asyncio.to_thread(ctx.deps.gmail_service.list_emails, max_results=max_results)
     
     # Update emails in context
     ctx.deps.emails = emails
@@ -19,12 +20,12 @@ async def list_emails(ctx: RunContext[GmailDeps], max_results: int = 10) -> str:
     if not emails:
         return "No emails found in your inbox."
     
-    result = [f"\nFound {len(emails)} recent emails:", "=" * 60]
-    for i, email in enumerate(emails, 1):
-        result.append(f"\n{i}. {email['subject']}")
-        result.append(f"   From: {email['from']}")
-        result.append(f"   Date: {email['date']}")
-        result.append(f"   {email['snippet'][:80]}...")
-    
-    result.append("\n" + "=" * 60)
-    return "\n".join(result)
+    separator = "=" * 60
+    entries = "\n".join(
+        f"\n{i}. {email['subject']}\n"
+        f"   From: {email['from']}\n"
+        f"   Date: {email['date']}\n"
+        f"   {email['snippet'][:80]}..."
+        for i, email in enumerate(emails, 1)
+    )
+    return f"\nFound {len(emails)} recent emails:\n{separator}\n{entries}\n\n{separator}"
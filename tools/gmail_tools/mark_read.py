@@ -1,7 +1,9 @@
-"""Gmail tool: mark_email_as_read"""
+"""Gmail tools: mark_email_as_read, mark_emails_as_read"""
 
+import asyncio
+from typing import List
 from pydantic_ai import RunContext
-from tools.gmail_tools.core import GmailDeps
+from tools.gmail_tools.core import GmailDeps, lookup_email, resolve_email_numbers
 
 
 async def mark_email_as_read(ctx: RunContext[GmailDeps], email_number: int) -> str:
@@ -11,18 +13,35 @@ async def mark_email_as_read(ctx: RunContext[GmailDeps], email_number: int) -> s
     Args:
         email_number: The number of the email from the most recent list
     """
-    emails = ctx.deps.emails
+    email, error = lookup_email(ctx.deps.emails, email_number)
+    if error:
+        return error
     
-    if not emails:
-        return "No emails in context. Please list emails first."
-    
-    if email_number < 1 or email_number > len(emails):
-        return f"Invalid email number. Please choose between 1 and {len(emails)}."
-    
-    email_id = emails[email_number - 1]['id']
-    success = ctx.deps.gmail_service.mark_as_read(email_id)
+    email_id = email['id']
+    success = await asyncio.to_thread(ctx.deps.gmail_service.mark_as_read, email_id)
     
     if success:
         return f"Email {email_number} marked as read successfully"
     else:
         return "Failed to mark email as read"
+
+
+async def mark_emails_as_read(ctx: RunContext[GmailDeps], email_numbers: List[int]) -> str:
+    """
+    Mark several emails as read in a single request.
+    
+    Use this instead of calling the single-email tool repeatedly.
+    
+    Args:
+        email_numbers: The numbers of the emails from the most recent list (e.g., [1, 2, 5])
+    """
+    email_ids, error = resolve_email_numbers(ctx.deps.emails, email_numbers)
+    if error:
+        return error
+    
+    success = await asyncio.to_thread(ctx.deps.gmail_service.batch_mark_as_read, email_ids)
+    
+    if success:
+        return f"Marked {len(email_ids)} emails as read"
+    else:
+        return "Failed to mark emails as read"
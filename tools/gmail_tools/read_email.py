@@ -1,7 +1,8 @@
 """Gmail tool: read_email"""
 
+import asyncio
 from pydantic_ai import RunContext
-from tools.gmail_tools.core import GmailDeps
+from tools.gmail_tools.core import GmailDeps, lookup_email
 
 
 async def read_email(ctx: RunContext[GmailDeps], email_number: int) -> str:
@@ -11,16 +12,12 @@ async def read_email(ctx: RunContext[GmailDeps], email_number: int) -> str:
     Args:
         email_number: The number of the email from the most recent list (e.g., 1 for first email)
     """
-    emails = ctx.deps.emails
+    email, error = lookup_email(ctx.deps.emails, email_number)
+    if error:
+        return error
     
-    if not emails:
-        return "No emails in context. Please list or search for emails first."
-    
-    if email_number < 1 or email_number > len(emails):
-        return f"Invalid email number. Please choose between 1 and {len(emails)}."
-    
-    email_id = emails[email_number - 1]['id']
-    email = ctx.deps.gmail_service.get_email(email_id)
+    email_id = email['id']
+    email = await asyncio.to_thread(ctx.deps.gmail_service.get_email, email_id)
     
     if not email:
         return "Could not retrieve email details."
@@ -1,7 +1,9 @@
-"""Gmail tool: remove_label_from_email"""
+"""Gmail tools: remove_label_from_email, remove_label_from_emails"""
 
+import asyncio
+from typing import List
 from pydantic_ai import RunContext
-from tools.gmail_tools.core import GmailDeps
+from tools.gmail_tools.core import GmailDeps, lookup_email, resolve_email_numbers
 
 
 async def remove_label_from_email(ctx: RunContext[GmailDeps], email_number: int, label_name: str) -> str:
@@ -12,31 +14,47 @@ async def remove_label_from_email(ctx: RunContext[GmailDeps], email_number: int,
         email_number: The number of the email from the most recent list
         label_name: The name of the label to remove (e.g., "IMPORTANT", "STARRED", or custom label name)
     """
-    emails = ctx.deps.emails
+    email, error = lookup_email(ctx.deps.emails, email_number)
+    if error:
+        return error
     
-    if not emails:
-        return "No emails in context. Please list emails first."
+    # Match the label name or ID case-insensitively (label list is cached)
+    label_id = await asyncio.to_thread(ctx.deps.gmail_service.find_label_id, label_name)
     
-    if email_number < 1 or email_number > len(emails):
-        return f"Invalid email number. Please choose between 1 and {len(emails)}."
+    if not label_id:
+        return f"Label '{label_name}' not found. Use get_labels to see available labels."
+    
+    email_id = email['id']
+    success = await asyncio.to_thread(ctx.deps.gmail_service.remove_label, email_id, label_id)
+    
+    if success:
+        return f"Label '{label_name}' removed from email {email_number}"
+    else:
+        return "Failed to remove label"
+
+
+async def remove_label_from_emails(ctx: RunContext[GmailDeps], email_numbers: List[int], label_name: str) -> str:
+    """
+    Remove a label from several emails in a single request.
+    
+    Use this instead of calling remove_label_from_email repeatedly.
     
-    # Get all labels to find the matching label ID
-    labels = ctx.deps.gmail_service.get_labels()
-    label_id = None
+    Args:
+        email_numbers: The numbers of the emails from the most recent list (e.g., [1, 2, 5])
+        label_name: The name of the label to remove (e.g., "IMPORTANT", "STARRED", or custom label name)
+    """
+    email_ids, error = resolve_email_numbers(ctx.deps.emails, email_numbers)
+    if error:
+        return error
     
-    # Check for exact match or case-insensitive match
-    for label in labels:
-        if label['name'].upper() == label_name.upper() or label['id'].upper() == label_name.upper():
-            label_id = label['id']
-            break
+    label_id = await asyncio.to_thread(ctx.deps.gmail_service.find_label_id, label_name)
     
     if not label_id:
         return f"Label '{label_name}' not found. Use get_labels to see available labels."
     
-    email_id = emails[email_number - 1]['id']
-    success = ctx.deps.gmail_service.remove_label(email_id, label_id)
+    success = await asyncio.to_thread(ctx.deps.gmail_service.batch_modify_labels, email_ids, remove_label_ids=[label_id])
     
     if success:
-        return f"Label '{label_name}' removed from email {email_number}"
+        return f"Label '{label_name}' removed from {len(email_ids)} emails"
     else:
         return "Failed to remove label"
@@ -1,5 +1,6 @@
 """Gmail tool: search_emails"""
 
+import asyncio
 from pydantic_ai import RunContext
 from tools.gmail_tools.core import GmailDeps
 
@@ -61,7 +62,11 @@ async def search_emails(ctx: RunContext[GmailDeps], query: str, max_results: int
         - "from:john has:attachment" - emails from John with attachments
         - "in:sent to:sarah" - emails I sent to Sarah
     """
-    emails = ctx.deps.gmail_service.search_emails(search_query=query, max_results=max_results)
+    emails = await asyncio.to_thread(
+        ctx.deps.gmail_service.search_emails,
+        search_query=query,
+        max_results=max_results
+    )
     
     # Update emails in context
     ctx.deps.emails = emails
@@ -69,12 +74,12 @@ async def search_emails(ctx: RunContext[GmailDeps], query: str, max_results: int
     if not emails:
         return f"No emails found matching: {query}"
     
-    result = [f"\nFound {len(emails)} emails matching '{query}':", "=" * 60]
-    for i, email in enumerate(emails, 1):
-        result.append(f"\n{i}. {email['subject']}")
-        result.append(f"   From: {email['from']}")
-        result.append(f"   Date: {email['date']}")
-        result.append(f"   {email['snippet'][:80]}...")
-    
-    result.append("\n" + "=" * 60)
-    return "\n".join(result)
+    separator = "=" * 60
+    entries = "\n".join(
+        f"\n{i}. {email['subject']}\n"
+        f"   From: {email['from']}\n"
+        f"   Date: {email['date']}\n"
+        f"   {email['snippet'][:80]}..."
+        for i, email in enumerate(emails, 1)
+    )
+    return f"\nFound {len(emails)} emails matching '{query}':\n{separator}\n{entries}\n\n{separator}"
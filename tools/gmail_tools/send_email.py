@@ -1,5 +1,6 @@
 """Gmail tool: send_email"""
 
+import asyncio
 from pydantic_ai import RunContext
 from tools.gmail_tools.core import GmailDeps
 
@@ -13,7 +14,7 @@ async def send_email(ctx: RunContext[GmailDeps], to: str, subject: str, body: st
         subject: Email subject
         body: Email body text
     """
-    success = ctx.deps.gmail_service.send_email(to, subject, body)
+    success = await asyncio.to_thread(ctx.deps.gmail_service.send_email, to, subject, body)
     
     if success:
         return f"Email sent successfully to {to}"
@@ -1,7 +1,8 @@
 """Gmail tool: unsubscribe_from_email"""
 
+import asyncio
 from pydantic_ai import RunContext
-from tools.gmail_tools.core import GmailDeps
+from tools.gmail_tools.core import GmailDeps, lookup_email
 
 
 async def unsubscribe_from_email(ctx: RunContext[GmailDeps], email_number: int) -> str:
@@ -19,20 +20,16 @@ async def unsubscribe_from_email(ctx: RunContext[GmailDeps], email_number: int)
     Returns:
         Status of unsubscribe attempt with instructions if needed
     """
-    emails = ctx.deps.emails
+    email, error = lookup_email(ctx.deps.emails, email_number)
+    if error:
+        return error
     
-    if not emails:
-        return "No emails in context. Please list emails first using list_emails or search_emails."
-    
-    if email_number < 1 or email_number > len(emails):
-        return f"Invalid email number. Please choose between 1 and {len(emails)}."
-    
-    email_id = emails[email_number - 1]['id']
-    email_from = emails[email_number - 1]['from']
-    email_subject = emails[email_number - 1]['subject']
+    email_id = email['id']
+    email_from = email['from']
+    email_subject = email['subject']
     
     # Get unsubscribe information
-    unsub_info = ctx.deps.gmail_service.get_unsubscribe_info(email_id)
+    unsub_info = await asyncio.to_thread(ctx.deps.gmail_service.get_unsubscribe_info, email_id)
     
     if not unsub_info:
         return (
@@ -60,7 +57,8 @@ async def unsubscribe_from_email(ctx: RunContext[GmailDeps], email_number: int)
             # One-Click Unsubscribe - Safe to automate
             result.append(f"Method {i}: One-Click Unsubscribe (Automatic)")
             
-            success = ctx.deps.gmail_service.unsubscribe_one_click(
+            success = await asyncio.to_thread(
+                ctx.deps.gmail_service.unsubscribe_one_click,
                 url=method['url'],
                 post_data=method.get('post_data', 'List-Unsubscribe=One-Click')
             )
@@ -79,7 +77,8 @@ async def unsubscribe_from_email(ctx: RunContext[GmailDeps], email_number: int)
             result.append(f"  To: {method['address']}")
             
             # Create a draft unsubscribe email
-            draft_id = ctx.deps.gmail_service.create_draft(
+            draft_id = await asyncio.to_thread(
+                ctx.deps.gmail_service.create_draft,
                 to=method['address'],
                 subject="Unsubscribe",
                 body="Please unsubscribe me from this mailing list."